@@ -1,9 +1,9 @@
 import os
 from time import time
-import binascii
 import math
 import os.path
 import sys
+from black_hole import bits_to_bytes, bytes_to_bits
 # @Author Jurijus Pacalovas
 
 # Get the name of the current script
@@ -25,27 +25,14 @@ class compression:
 
                 with open(name + ".b", "wb") as f2:
 
-                    f2.write(
-
-                        binascii.unhexlify(
-
-                            ("%0" + str((len(File_information5_17) // 8) * 2) + "x")
-
-                            % int(File_information5_17, 2)
-
-                        )
-
-                    )
+                    f2.write(bits_to_bytes(File_information5_17))
 
                     return str(time() - x)
 
         def process_file(Extract1=0, File_information5_17="Ex", name="", x=0):
             if Extract1 == 1:
-                width_bits = (
-                    "%0" + str((len(File_information5_17) // 8) * 2) + "x"
-                ) % int(File_information5_17, 2)
                 with open(name[:-2], "wb") as f2:
-                    f2.write(binascii.unhexlify(width_bits))
+                    f2.write(bits_to_bytes(File_information5_17))
                     return str(time() - x)
         def Count_adds(En, Row1, Row):
             Row += 1
@@ -148,34 +135,13 @@ class compression:
                     D = 1
                     if D == 1:
                         if File_information6_Times3 == 1:
-                            INFO = bin(int(binascii.hexlify(data), 16))[
-                                2:
-                            ]  # data to binary
-                            long_1 = len(INFO)
+                            INFO = bytes_to_bits(data)  # data to binary
                             long_11 = len(data)
-                            count_bits = (long_11 * 8) - long_1
-                            z = 0
-                            if count_bits != 0:
-                                while z < count_bits:
-                                    INFO = "0" + INFO
-
-                                    z = z + 1
-
                             if File_information6_Times3 == 1:
 
                                 File_information5_2 = INFO
 
-                            n = int(File_information5_2, 2)
-
-                            width_bits = len(File_information5_2)
-
-                            width_bits = (width_bits / 8) * 2
-
-                            width_bits = str(width_bits)
-
-                            width_bits = "%0" + width_bits + "x"
-
-                            width_bits3 = binascii.unhexlify(width_bits % n)
+                            width_bits3 = bits_to_bytes(File_information5_2)
 
                             width_bits2 = len(width_bits3)
 
@@ -183,24 +149,10 @@ class compression:
 
                             long_15 = len(data)
                             
-                            INFO = bin(int(binascii.hexlify(data), 16))[2:]
-
-                            long_1 = len(INFO)
+                            INFO = bytes_to_bits(data)
 
                             long_11 = len(data)
 
-                            count_bits = (long_11 * 8) - long_1
-
-                            z = 0
-
-                            if count_bits != 0:
-
-                                while z < count_bits:
-
-                                    INFO = "0" + INFO
-
-                                    z = z + 1
-
                             Check = INFO
 
                             File_information5_2 = INFO
@@ -854,31 +806,11 @@ class compression:
 
 
 
-                                                add_bits = ""
-
-
-
                                                 count_bits = 8 - long_1 % 8
 
 
 
-                                                z = 0
-
-
-
-                                                if count_bits != 0:
-
-
-
-                                                    while z < count_bits:
-
-
-
-                                                        add_bits = "0" + add_bits
-
-
-
-                                                        z = z + 1
+                                                add_bits = "0" * count_bits
 
 
 
@@ -1983,35 +1915,7 @@ class compression:
 
 
 
-                                    L = len(File_information5_17)
-
-
-
-                                    # print(L)
-
-
-
-                                    n = int(File_information5_17, 2)
-
-
-
-                                    width_bits = len(File_information5_17)
-
-
-
-                                    width_bits = (width_bits // 8) * 2
-
-
-
-                                    width_bits = str(width_bits)
-
-
-
-                                    width_bits = "%0" + width_bits + "x"
-
-
-
-                                    width_bits3 = binascii.unhexlify(width_bits % n)
+                                    width_bits3 = bits_to_bytes(File_information5_17)
 
 
 
@@ -2108,27 +2012,7 @@ class compression:
 
 
 
-                                        n = int(File_information5_17, 2)
-
-
-
-                                        width_bits = len(File_information5_17)
-
-
-
-                                        width_bits = (width_bits // 8) * 2
-
-
-
-                                        width_bits = str(width_bits)
-
-
-
-                                        width_bits = "%0" + width_bits + "x"
-
-
-
-                                        width_bits3 = binascii.unhexlify(width_bits % n)
+                                        width_bits3 = bits_to_bytes(File_information5_17)
 
 
 
@@ -2711,14 +2595,8 @@ class compression:
                                                 File_information5_17 = TUPLE
 
                                                 long_1 = len(File_information5_17)
-                                                add_bits = ""
                                                 count_bits = 8 - long_1 % 8
-                                                z = 0
-                                                if count_bits != 0:
-                                                    while z < count_bits:
-                                                        add_bits = "0" + add_bits
-
-                                                        z = z + 1
+                                                add_bits = "0" * count_bits
 
                                                 File_information5_17 = (
                                                     File_information5_17
@@ -2727,24 +2605,7 @@ class compression:
 
                                                 if Extract1 == 1:
 
-                                                    L = len(File_information5_17)
-
-                                                    n = int(File_information5_17, 2)
-
-                                                    width_bits = len(
-
-                                                        File_information5_17
-
-                                                    )
-
-                                                    width_bits = (width_bits // 8) * 2
-
-                                                    width_bits = str(width_bits)
-                                                    width_bits = "%0" + width_bits + "x"
-                                                    width_bits3 = binascii.unhexlify(
-                                                        width_bits % n
-
-                                                    )
+                                                    width_bits3 = bits_to_bytes(File_information5_17)
                                                     width_bits2 = len(width_bits3)
 
                                                     File_information5_2 = Clear
@@ -1,27 +1,20 @@
-import os
 import time
 import zstandard as zstd
 from pathlib import Path
 import math
 from qiskit import QuantumCircuit
+from black_hole import ChunkReverser, IOCounter
 
-# Function to reverse data in chunks
-def reverse_and_save(input_filename, reversed_filename, chunk_size):
-    with open(input_filename, 'rb') as infile, open(reversed_filename, 'wb') as outfile:
-        while chunk := infile.read(chunk_size):
-            outfile.write(chunk[::-1])  # Reverse each chunk before writing
+# Function to reverse every chunk of the data
+def reverse_all_chunks(reverser, chunk_size):
+    num_chunks = (reverser.size + chunk_size - 1) // chunk_size
+    return reverser.apply(chunk_size, range(num_chunks))
 
 # Function to compress and embed chunk size
-def compress_reversed(reversed_filename, compressed_filename, chunk_size):
-    with open(reversed_filename, 'rb') as infile:
-        reversed_data = infile.read()
-    
+def compress_reversed(reversed_data, chunk_size):
     # Embed the chunk size at the beginning (4 bytes, big-endian)
     chunk_size_bytes = chunk_size.to_bytes(4, 'big')
-    compressed_data = zstd.compress(chunk_size_bytes + reversed_data)
-
-    with open(compressed_filename, 'wb') as outfile:
-        outfile.write(compressed_data)
+    return zstd.compress(chunk_size_bytes + reversed_data)
 
 # Function to decompress and restore the original file
 def decompress_and_restore(compressed_filename, restored_filename):
@@ -42,31 +35,23 @@ def decompress_and_restore(compressed_filename, restored_filename):
     with open(restored_filename, 'wb') as outfile:
         outfile.write(restored_data)
 
-# Function to determine the best chunk size
-def find_best_chunk_size(input_filename):
-    file_size = os.path.getsize(input_filename)
+# Function to determine the best chunk size, in memory on one buffer
+def find_best_chunk_size(reverser):
+    file_size = reverser.size
     best_chunk_size = 1
     best_compression_ratio = float('inf')
 
     print(f"📏 Checking best chunk size from 1 to {file_size} bytes...")
 
     for chunk_size in range(1, file_size + 1):
-        reversed_file = input_filename + ".rev"
-        compressed_file = f"compress.{Path(input_filename).name}.b"
-        
-        reverse_and_save(input_filename, reversed_file, chunk_size)
-        compress_reversed(reversed_file, compressed_file, chunk_size)
-
-        compressed_size = os.path.getsize(compressed_file)
+        reversed_data = reverse_all_chunks(reverser, chunk_size)
+        compressed_size = len(compress_reversed(reversed_data, chunk_size))
         compression_ratio = compressed_size / file_size
 
         if compression_ratio < best_compression_ratio:
             best_compression_ratio = compression_ratio
             best_chunk_size = chunk_size
 
-        os.remove(reversed_file)
-        os.remove(compressed_file)
-
     print(f"✅ Best chunk size: {best_chunk_size} bytes (Compression Ratio: {best_compression_ratio:.4f})")
     return best_chunk_size
 
@@ -83,18 +68,20 @@ def quantum_compression_simulation(file_size):
 
 # Compression process
 def process_compression(input_filename):
-    file_size = os.path.getsize(input_filename)
-    best_chunk_size = find_best_chunk_size(input_filename)
+    io = IOCounter()
+    reverser = ChunkReverser(io.read(input_filename))
+    file_size = reverser.size
+    best_chunk_size = find_best_chunk_size(reverser)
+    print(f"💾 Search {io.report()}")
 
-    reversed_file = input_filename + ".rev"
     compressed_file = f"compress.{Path(input_filename).name}.b"
     restored_file = f"extract.{Path(input_filename).name}"
 
     # Start compression timer
     start_compress = time.perf_counter_ns()
 
-    reverse_and_save(input_filename, reversed_file, best_chunk_size)
-    compress_reversed(reversed_file, compressed_file, best_chunk_size)
+    reversed_data = reverse_all_chunks(reverser, best_chunk_size)
+    io.write(compressed_file, compress_reversed(reversed_data, best_chunk_size))
 
     # End compression timer
     end_compress = time.perf_counter_ns()
@@ -115,8 +102,6 @@ def process_compression(input_filename):
 
     print(f"✅ Three files remain:\n  1️⃣ Original: '{input_filename}'\n  2️⃣ Best Compressed: '{compressed_file}'\n  3️⃣ Restored: '{restored_file}'")
 
-    os.remove(reversed_file)  # Cleanup temporary file
-
 # Extraction process
 def process_extraction(input_filename):
     restored_file = f"extract.{Path(input_filename).name.replace('compress.', '').replace('.b', '')}"
@@ -1,9 +1,9 @@
-import os
 import time
 import zstandard as zstd  # Importing Zstd for compression
 from pathlib import Path
 import struct
 from qiskit import QuantumCircuit
+from black_hole import ChunkReverser, IOCounter
 
 # Function to run a quantum computation (without Aer, transpile, or execute)
 def quantum_computation_example():
@@ -25,33 +25,14 @@ def quantum_computation_example():
     print("\nQuantum Circuit:")
     print(circuit)
 
-# Function to reverse data in chunks based on chunk count
-def reverse_and_save(input_filename, reversed_filename, chunk_size, num_chunks):
-    with open(input_filename, 'rb') as infile, open(reversed_filename, 'wb') as outfile:
-        data = infile.read()
-        chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
-        
-        # Reverse the first `num_chunks` chunks
-        for i in range(num_chunks):
-            if i < len(chunked_data):
-                chunked_data[i] = chunked_data[i][::-1]
-        
-        outfile.write(b"".join(chunked_data))
-
-# Function to compress and save metadata (chunk size + num_chunks) with Zstd
-def compress_reversed_with_zstd(reversed_filename, compressed_filename, chunk_size, num_chunks):
-    with open(reversed_filename, 'rb') as infile:
-        reversed_data = infile.read()
-
+# Function to compress with metadata (chunk size + num_chunks) with Zstd
+def compress_reversed_with_zstd(reversed_data, chunk_size, num_chunks):
     # Store metadata (num_chunks) in the first 2 bytes
     metadata = struct.pack(">H", num_chunks)  # Store num_chunks as a 10-bit value in 2 bytes
 
     # Compress data using Zstd
     cctx = zstd.ZstdCompressor()
-    compressed_data = cctx.compress(metadata + reversed_data)
-
-    with open(compressed_filename, 'wb') as outfile:
-        outfile.write(compressed_data)
+    return cctx.compress(metadata + reversed_data)
 
 # Function to decompress and restore the original file with Zstd
 def decompress_and_restore_with_zstd(compressed_filename, restored_filename):
@@ -78,9 +59,10 @@ def decompress_and_restore_with_zstd(compressed_filename, restored_filename):
     with open(restored_filename, 'wb') as outfile:
         outfile.write(restored_data)
 
-# Function to determine the best chunk size and number of reversed chunks
-def find_best_parameters(input_filename):
-    file_size = os.path.getsize(input_filename)
+# Function to determine the best chunk size and number of reversed chunks,
+# in memory on one buffer
+def find_best_parameters(reverser):
+    file_size = reverser.size
     best_chunk_size = 1
     best_num_chunks = 1
     best_compression_ratio = float('inf')
@@ -88,14 +70,13 @@ def find_best_parameters(input_filename):
     print(f"📏 Finding the best parameters (chunk size and reversed chunks)...")
 
     for chunk_size in range(1, file_size + 1):
+        reverser.revert()
         for num_chunks in range(1, file_size // chunk_size + 1):
-            reversed_file = input_filename + ".rev"
-            compressed_file = f"compress.{Path(input_filename).name}.b"
-
-            reverse_and_save(input_filename, reversed_file, chunk_size, num_chunks)
-            compress_reversed_with_zstd(reversed_file, compressed_file, chunk_size, num_chunks)
+            # The first `num_chunks` chunks: one more than the last candidate
+            reversed_data = reverser.reverse(chunk_size, [num_chunks - 1])
+            compressed_data = compress_reversed_with_zstd(reversed_data, chunk_size, num_chunks)
 
-            compressed_size = os.path.getsize(compressed_file)
+            compressed_size = len(compressed_data)
             compression_ratio = compressed_size / file_size
 
             if compression_ratio < best_compression_ratio:
@@ -103,26 +84,25 @@ def find_best_parameters(input_filename):
                 best_chunk_size = chunk_size
                 best_num_chunks = num_chunks
 
-            os.remove(reversed_file)
-            os.remove(compressed_file)
-
     print(f"✅ Best chunk size: {best_chunk_size}, best reversed chunks: {best_num_chunks} (Compression Ratio: {best_compression_ratio:.4f})")
     return best_chunk_size, best_num_chunks
 
 # Compression process with nanosecond timing
 def process_compression(input_filename):
-    file_size = os.path.getsize(input_filename)
-    best_chunk_size, best_num_chunks = find_best_parameters(input_filename)
+    io = IOCounter()
+    reverser = ChunkReverser(io.read(input_filename))
+    best_chunk_size, best_num_chunks = find_best_parameters(reverser)
+    print(f"💾 Search {io.report()}")
 
-    reversed_file = input_filename + ".rev"
     compressed_file = f"compress.{Path(input_filename).name}.b"
     restored_file = f"extract.{Path(input_filename).name}"
 
     # Start compression timer
     start_compress = time.perf_counter_ns()
 
-    reverse_and_save(input_filename, reversed_file, best_chunk_size, best_num_chunks)
-    compress_reversed_with_zstd(reversed_file, compressed_file, best_chunk_size, best_num_chunks)
+    reversed_data = reverser.apply(best_chunk_size, range(best_num_chunks))
+    compressed_data = compress_reversed_with_zstd(reversed_data, best_chunk_size, best_num_chunks)
+    io.write(compressed_file, compressed_data)
 
     # End compression timer
     end_compress = time.perf_counter_ns()
@@ -141,8 +121,6 @@ def process_compression(input_filename):
 
     print(f"✅ Three files remain:\n  1️⃣ Original: '{input_filename}'\n  2️⃣ Best Compressed: '{compressed_file}'\n  3️⃣ Restored: '{restored_file}'")
 
-    os.remove(reversed_file)  # Cleanup temporary file
-
 # Extraction process with nanosecond timing
 def process_extraction(input_filename):
     restored_file = f"extract.{Path(input_filename).name.replace('compress.', '').replace('.b', '')}"
@@ -2,11 +2,13 @@ import os
 
 from time import time
 
-import binascii
-
 import math
 
 import os.path
+
+import sys
+
+from black_hole import TargetFilter, bits_to_bytes, bytes_to_bits, decode_university, hole_step
  
 long_1=0
 
@@ -52,26 +54,16 @@ class compression:
 
                           
 
-                def process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts):
+                def process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts):
 
                         Before_X = Number_of_the_file
 
-                        Square_of_ROOT = Hole_Number_information
-
-                        if Square_of_ROOT<=Key:
-
-                               Square_of_ROOT=Key
-
-                              
-
-                                  
-
                         if Number_of_the_file>=2**26*1024*1024:
                            Number_of_the_file=2**26*1024*1024
                                 
                         
 
-                        Number_of_the_file =((((Number_of_the_file * Square_of_ROOT) + Add_Numbers) // 3) * Multiply)
+                        Number_of_the_file = hole_step(Number_of_the_file, Deep5, Add_Numbers, Multiply, Key)
                         #print(Number_of_the_file)
 
                         F=0
@@ -94,7 +86,7 @@ class compression:
 
                 
 
-                        return Number_of_the_file, Square_of_ROOT, Add_Numbers, Multiply, counts
+                        return Number_of_the_file, Deep5, Add_Numbers, Multiply, counts
 
                 self.name = "Written: Jurijus pacalovas"
 
@@ -235,39 +227,15 @@ class compression:
 
                                 if File_information6_Times3==1:
 
-                                    INFO=bin(int(binascii.hexlify(data),16))[2:]#data to binary
-
-                                    long_1=len(INFO)
+                                    INFO = bytes_to_bits(data)  #data to binary
 
                                     long_11=len(data)
 
-                                    count_bits=(long_11*8)-long_1
-
-                                    z=0
-
-                                    if count_bits!=0:
-
-                                        while z<count_bits:
-
-                                            INFO="0"+INFO
-
-                                            z=z+1
-
                                     if File_information6_Times3==1:
 
                                         File_information5_2=INFO
 
-                                    n = int(File_information5_2, 2)
-
-                                    width_bits=len(File_information5_2)
-
-                                    width_bits=(width_bits/8)*2
-
-                                    width_bits=str(width_bits)
-
-                                    width_bits="%0"+width_bits+"x"
-
-                                    width_bits3=binascii.unhexlify(width_bits % n)                                    
+                                    width_bits3 = bits_to_bytes(File_information5_2)
 
                                     width_bits2=len(width_bits3)
 
@@ -275,24 +243,10 @@ class compression:
 
                                     long_15=len(data)
 
-                                    INFO=bin(int(binascii.hexlify(data),16))[2:]
-
-                                    long_1=len(INFO)
+                                    INFO = bytes_to_bits(data)
 
                                     long_11=len(data)
 
-                                    count_bits=(long_11*8)-long_1
-
-                                    z=0
-
-                                    if count_bits!=0:
-
-                                        while z<count_bits:
-
-                                            INFO="0"+INFO
-
-                                            z=z+1
-
                                     File_information5_2=INFO
 
                                     Extact=File_information5_2
@@ -373,6 +327,10 @@ class compression:
                                     num=0
                                     result=0
 
+                                    target = TargetFilter(int(INFO,2))
+
+                                    Number_of_the_chain=0
+
                                     while Extract1!=1:
 
                                             k1+=1
@@ -407,8 +365,6 @@ class compression:
 
                                             X2=X1
 
-                                            C11="0"+str(((8*X2)+40))+"b"
-
                                             if k2>(2**((8*X1)+40)-1):
 
                                                     University=5
@@ -423,18 +379,8 @@ class compression:
 
                                            
 
-                                            University_file=format(University,C11)
-
-                                            Divide=int(University_file[0:(X2*8)],2)
-
-                                            Times_12=int(University_file[(X2*8):(X2*8)+8],2)
-
-                                            Multiply=int(University_file[(X2*8)+8:(X2*8)+16],2)
-
-                                            Add_Numbers=int(University_file[(X2*8)+16:(X2*8)+24],2)
+                                            Divide, Times_12, Multiply, Add_Numbers, SQUARE_OF_ROOT, Multiply_Times = decode_university(University, X2)
 
-                                            SQUARE_OF_ROOT=int(University_file[(X2*8)+24:(X2*8)+32],2)
-                                            Multiply_Times=int(University_file[(X2*8)+32:(X2*8)+40],2)
                                             #print(X1)
                                     
                                  
@@ -521,46 +467,12 @@ class compression:
 
                                                 Multiply=1 
 
-                                            File_information52=""
-
-                                            File_information53=""
-
-                                            File_information54=""
-
-                                            Add_N=""
-
-                                            File_information52=format(SQUARE_OF_ROOT,'024b')
-
-                                            File_information53=format(Multiply,'024b')
-
-                                            Add_N=format(Add_Numbers,'024b')
-
-                                            if   File_information6_Times2==0:
-
-                                                File_information54=format(Multiply_Times,'040b')
-
-                                                File_information5_2=File_information54
-
-                                            File_information54=File_information5_2
-
-                                            File_information53=format(Multiply,'024b')                                            
-
-                                            File_information5_2=File_information54
-
                                             File_information5_17=""
 
-                                            long_16=len(File_information54)
-
                                             add_bits=""
 
-                                            Clear=""
-
-                                            INFO10=""
-
                                             Translate_info_Decimal=""
 
-                                            Clear=""
-
                                             Number_of_the_file=0
 
                                             C=1
@@ -569,25 +481,7 @@ class compression:
 
                                                 if   File_information6_Times2==0:
 
-                                                        long_16=len(File_information54)
-
-                                                        INFO10=File_information52
-
-                                                        Deep5 = int(INFO10, 2)
-
-                                                        long_16=len(File_information54)
-
-                                                        File_information54=File_information5_2
-
-                                                        Clear=File_information53
-
-                                                        Add_N=Add_N
-
-                                                        T = int(Clear, 2)
-
-                                                        Add= int(Add_N, 2)
-
-                                                        long_16=len(File_information54)
+                                                        Deep5 = SQUARE_OF_ROOT
 
                                                         Times_half_Real=0
 
@@ -597,48 +491,29 @@ class compression:
 
                                                 if C==1 and Times_12!=0:
 
-                                                        File_information54=File_information54
-
-                                                        long_16=len(File_information54)
+                                                        if File_information6_Times2==0:
 
-                                                        if len (File_information54)!=0:
-
-                                                            Number_of_the_file=int(File_information54, 2)
+                                                            Number_of_the_file=Multiply_Times
 
                                                         else:
 
-                                                            Number_of_the_file=0
-
-                                                        if Deep5<=26*1024*1024:
+                                                            Number_of_the_file=Number_of_the_chain
 
-                                                                Hole_Number_information=(2**Deep5)-1
-
-                                                        else:
+                                                        if Deep5>26*1024*1024:
 
                                                                 Deep5=26*1024*1024
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
-                                                                
-
-                                                        Square_of_ROOT=Hole_Number_information
-
-                                                        Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts)
+                                                        Number_of_the_file, Deep5, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts)
 
 
 
                                                         Times_half_Real+=1
 
-                                            File_information5_17=bin(Number_of_the_file)[2:]
-
-                                            File_information5_2=File_information5_17
+                                            Number_of_the_chain=Number_of_the_file
 
                                             if i==1:
 
-                                                Make_togher=""
-
-                                                Make_togher=Clear
-
                                                 add_bits=""
 
                                                 if C==1 and Times_12!=0:
@@ -653,13 +528,13 @@ class compression:
 
                                                         File_information6_Times2=0
 
-                                                        if int(INFO,2)==Number_of_the_file:  
+                                                        if target.matches(Number_of_the_file):  
 
                                                                if C==1:
 
                                                                        C=1
 
-                                                if int(INFO,2)==Number_of_the_file and File_information6_Times2_1==Times_12:
+                                                if target.matches(Number_of_the_file) and File_information6_Times2_1==Times_12:
 
                                                        long_1=len(File_information5_17)
 
@@ -695,50 +570,28 @@ class compression:
 
                                                        Counts=Time_Real4+Time_Real1+Time_Real3
 
-                                                       if int(INFO,2)==Number_of_the_file and File_information6_Times2_1==Times_12:
+                                                       if target.matches(Number_of_the_file) and File_information6_Times2_1==Times_12:
 
                                                                File_information5_17="1"+XN+Counts+long_file
 
                                                                long_1=len(File_information5_17)
 
-                                                               add_bits=""
-
                                                                count_bits=8-long_1%8
 
-                                                               z=0
-
-                                                               if count_bits!=0:
-
-                                                                       while z<count_bits:
-
-                                                                               add_bits="0"+add_bits
-
-                                                                               z=z+1
+                                                               add_bits = "0" * count_bits
 
                                                                File_information5_17=add_bits+File_information5_17
 
                                                                Extract1=1
 
                                     if Extract1==1:                
+                                            if "--stats" in sys.argv:
+                                                print(target.report())
 
-                                            L=len(File_information5_17)
-
-                                            n = int(File_information5_17, 2)
-
-                                            width_bits=len(File_information5_17)
-
-                                            width_bits=(width_bits//8)*2
-
-                                            width_bits=str(width_bits)
-
-                                            width_bits="%0"+width_bits+"x"
-
-                                            width_bits3=binascii.unhexlify(width_bits % n)
+                                            width_bits3 = bits_to_bytes(File_information5_17)
 
                                             width_bits2=len(width_bits3)
 
-                                            File_information5_2=Clear
-
                                             name=name+".bin"
 
                                    
@@ -878,6 +731,10 @@ class compression:
                                     Universe=0
                                     num=0
                                     result=0
+
+                                    target = TargetFilter(int(INFO,2))
+
+                                    Number_of_the_chain=0
                                   
 
                                     while Extract1!=1:
@@ -911,8 +768,6 @@ class compression:
 
                                             X2=X1
 
-                                            C11="0"+str(((8*X2)+40))+"b"
-
                                             if k2>(2**((8*X1)+40)-1):
 
                                                     University=5
@@ -927,22 +782,8 @@ class compression:
 
                                            
 
-                                            University_file=format(University,C11)
-
-                                            Divide=int(University_file[0:(X2*8)],2)
-
-                                            Times_12=int(University_file[(X2*8):(X2*8)+8],2)
+                                            Divide, Times_12, Multiply, Add_Numbers, SQUARE_OF_ROOT, Multiply_Times = decode_university(University, X2)
 
-                                            Multiply=int(University_file[(X2*8)+8:(X2*8)+16],2)
-
-                                            Add_Numbers=int(University_file[(X2*8)+16:(X2*8)+24],2)
-
-                                            SQUARE_OF_ROOT=int(University_file[(X2*8)+24:(X2*8)+32],2)
-
-                                            Multiply_Times=int(University_file[(X2*8)+32:(X2*8)+40],2)
-                                         
-
-                                   
                                             # Initialize variables
                                             X4 = []  # Initialize an empty list X4
                                           # Initialize counter X1
@@ -1024,46 +865,12 @@ class compression:
 
                                                 Multiply=1 
 
-                                            File_information52=""
-
-                                            File_information53=""
-
-                                            File_information54=""
-
-                                            Add_N=""
-
-                                            File_information52=format(SQUARE_OF_ROOT,'024b')
-
-                                            File_information53=format(Multiply,'024b')
-
-                                            Add_N=format(Add_Numbers,'024b')
-
-                                            if   File_information6_Times2==0:
-
-                                                File_information54=format(Multiply_Times,'040b')
-
-                                                File_information5_2=File_information54
-
-                                            File_information54=File_information5_2
-
-                                            File_information53=format(Multiply,'024b')                                            
-
-                                            File_information5_2=File_information54
-
                                             File_information5_17=""
 
-                                            long_16=len(File_information54)
-
                                             add_bits=""
 
-                                            Clear=""
-
-                                            INFO10=""
-
                                             Translate_info_Decimal=""
 
-                                            Clear=""
-
                                             Number_of_the_file=0
 
                                             C=1
@@ -1072,25 +879,7 @@ class compression:
 
                                                 if   File_information6_Times2==0:
 
-                                                        long_16=len(File_information54)
-
-                                                        INFO10=File_information52
-
-                                                        Deep5 = int(INFO10, 2)
-
-                                                        long_16=len(File_information54)
-
-                                                        File_information54=File_information5_2
-
-                                                        Clear=File_information53
-
-                                                        Add_N=Add_N
-
-                                                        T = int(Clear, 2)
-
-                                                        Add= int(Add_N, 2)
-
-                                                        long_16=len(File_information54)
+                                                        Deep5 = SQUARE_OF_ROOT
 
                                                         Times_half_Real=0
 
@@ -1100,48 +889,28 @@ class compression:
 
                                                 if C==1 and Times_12!=0:
 
-                                                        File_information54=File_information54
-
-                                                        long_16=len(File_information54)
+                                                        if File_information6_Times2==0:
 
-                                                        if len (File_information54)!=0:
-
-                                                            Number_of_the_file=int(File_information54, 2)
+                                                            Number_of_the_file=Multiply_Times
 
                                                         else:
 
-                                                            Number_of_the_file=0
-
-                                                        Hole_Number_information=(2**Deep5)-1
+                                                            Number_of_the_file=Number_of_the_chain
 
-                                                        Square_of_ROOT=Hole_Number_information
-
-                                                        if Deep5<=26*1024*1024:
-
-                                                                Hole_Number_information=(2**Deep5)-1
-
-                                                        else:
+                                                        if Deep5>26*1024*1024:
 
                                                                 Deep5=26*1024*1024
 
-                                                                Hole_Number_information=(2**Deep5)-1
-
-                                                        Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts)
+                                                        Number_of_the_file, Deep5, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts)
 
 
 
                                                         Times_half_Real+=1
 
-                                            File_information5_17=bin(Number_of_the_file)[2:]
-
-                                            File_information5_2=File_information5_17
+                                            Number_of_the_chain=Number_of_the_file
 
                                             if i==2:
 
-                                                Make_togher=""
-
-                                                Make_togher=Clear
-
                                                 add_bits=""
 
                                                 if C==1 and Times_12!=0:
@@ -1156,7 +925,7 @@ class compression:
 
                                                         File_information6_Times2=0
 
-                                                        if int(INFO,2)==Number_of_the_file:  
+                                                        if target.matches(Number_of_the_file):  
 
                                                                if C==1:
 
@@ -1175,27 +944,13 @@ class compression:
                                                                Extract1=1
 
                                     if Extract1==1:                
+                                            if "--stats" in sys.argv:
+                                                print(target.report())
 
-                                            L=len(File_information5_17)
-
-                                            n = int(File_information5_17, 2)
-
-                                            width_bits=len(File_information5_17)
-
-                                            width_bits=(width_bits//8)*2
-
-                                            width_bits=str(width_bits)
-
-                                            width_bits="%0"+width_bits+"x"
-
-                                            width_bits3=binascii.unhexlify(width_bits % n)
+                                            width_bits3 = bits_to_bytes(File_information5_17)
 
                                             width_bits2=len(width_bits3)
 
-                                            File_information5_2=Clear
-
-           
-
                                             long_extract=len(name)
 
                                             name=name[:long_extract-4]
@@ -2,11 +2,11 @@ import os
 
 from time import time
 
-import binascii
-
 import math
 
 import os.path
+
+from black_hole import bits_to_bytes, bytes_to_bits
  
 long_1=0
 
@@ -238,39 +238,15 @@ class compression:
 
                                 if File_information6_Times3==1:
 
-                                    INFO=bin(int(binascii.hexlify(data),16))[2:]#data to binary
-
-                                    long_1=len(INFO)
+                                    INFO = bytes_to_bits(data)  #data to binary
 
                                     long_11=len(data)
 
-                                    count_bits=(long_11*8)-long_1
-
-                                    z=0
-
-                                    if count_bits!=0:
-
-                                        while z<count_bits:
-
-                                            INFO="0"+INFO
-
-                                            z=z+1
-
                                     if File_information6_Times3==1:
 
                                         File_information5_2=INFO
 
-                                    n = int(File_information5_2, 2)
-
-                                    width_bits=len(File_information5_2)
-
-                                    width_bits=(width_bits/8)*2
-
-                                    width_bits=str(width_bits)
-
-                                    width_bits="%0"+width_bits+"x"
-
-                                    width_bits3=binascii.unhexlify(width_bits % n)                                    
+                                    width_bits3 = bits_to_bytes(File_information5_2)
 
                                     width_bits2=len(width_bits3)
 
@@ -278,24 +254,10 @@ class compression:
 
                                     long_15=len(data)
 
-                                    INFO=bin(int(binascii.hexlify(data),16))[2:]
-
-                                    long_1=len(INFO)
+                                    INFO = bytes_to_bits(data)
 
                                     long_11=len(data)
 
-                                    count_bits=(long_11*8)-long_1
-
-                                    z=0
-
-                                    if count_bits!=0:
-
-                                        while z<count_bits:
-
-                                            INFO="0"+INFO
-
-                                            z=z+1
-
                                     File_information5_2=INFO
 
                                     Extact=File_information5_2
@@ -705,19 +667,9 @@ class compression:
 
                                                                long_1=len(File_information5_17)
 
-                                                               add_bits=""
-
                                                                count_bits=8-long_1%8
 
-                                                               z=0
-
-                                                               if count_bits!=0:
-
-                                                                       while z<count_bits:
-
-                                                                               add_bits="0"+add_bits
-
-                                                                               z=z+1
+                                                               add_bits = "0" * count_bits
 
                                                                File_information5_17=add_bits+File_information5_17
 
@@ -725,19 +677,7 @@ class compression:
 
                                     if Extract1==1:                
 
-                                            L=len(File_information5_17)
-
-                                            n = int(File_information5_17, 2)
-
-                                            width_bits=len(File_information5_17)
-
-                                            width_bits=(width_bits//8)*2
-
-                                            width_bits=str(width_bits)
-
-                                            width_bits="%0"+width_bits+"x"
-
-                                            width_bits3=binascii.unhexlify(width_bits % n)
+                                            width_bits3 = bits_to_bytes(File_information5_17)
 
                                             width_bits2=len(width_bits3)
 
@@ -1174,19 +1114,7 @@ class compression:
 
                                     if Extract1==1:                
 
-                                            L=len(File_information5_17)
-
-                                            n = int(File_information5_17, 2)
-
-                                            width_bits=len(File_information5_17)
-
-                                            width_bits=(width_bits//8)*2
-
-                                            width_bits=str(width_bits)
-
-                                            width_bits="%0"+width_bits+"x"
-
-                                            width_bits3=binascii.unhexlify(width_bits % n)
+                                            width_bits3 = bits_to_bytes(File_information5_17)
 
                                             width_bits2=len(width_bits3)
 
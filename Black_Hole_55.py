@@ -1,9 +1,9 @@
 import os
 from time import time
-import binascii
 import math
 import os.path
 import sys
+from black_hole import bits_to_bytes, bytes_to_bits
 
 # @Author Jurijus Pacalovas
 # Get the name of the current script
@@ -124,26 +124,10 @@ class compression:
 
                         if File_information6_Times3 == 1:
 
-                            INFO = bin(int(binascii.hexlify(data), 16))[
-                                2:
-                            ]  # data to binary
-
-                            long_1 = len(INFO)
+                            INFO = bytes_to_bits(data)  # data to binary
 
                             long_11 = len(data)
 
-                            count_bits = (long_11 * 8) - long_1
-
-                            z = 0
-
-                            if count_bits != 0:
-
-                                while z < count_bits:
-
-                                    INFO = "0" + INFO
-
-                                    z = z + 1
-
                             Check = INFO
 
                             File_information5_2 = INFO
@@ -740,23 +724,7 @@ class compression:
                                         File_information5_17 = (
                                             add_bits + File_information5_17
                                         )
-                                        L = len(File_information5_17)
-
-                                        # print(L)
-
-                                        n = int(File_information5_17, 2)
-
-                                        width_bits = len(File_information5_17)
-
-                                        width_bits = (width_bits // 8) * 2
-
-                                        width_bits = str(width_bits)
-
-                                        width_bits = "%0" + width_bits + "x"
-
-                                        width_bits3 = binascii.unhexlify(
-                                            width_bits % n
-                                        )
+                                        width_bits3 = bits_to_bytes(File_information5_17)
 
                                         width_bits2 = len(width_bits3)
 
@@ -1223,12 +1191,7 @@ class compression:
                                     File_information5_17 = TUPLE1
 
                                 if Extract1 == 1:
-                                    L = len(File_information5_17)
-                                    n = int(File_information5_17, 2)
-                                    width_bits = "%0" + str((L // 8) * 2) + "x"
-                                    width_bits3 = binascii.unhexlify(
-                                        width_bits % n
-                                    )
+                                    width_bits3 = bits_to_bytes(File_information5_17)
                                     width_bits2 = len(width_bits3)
                                     name2 = name[:-2]
                                     start_time = time()
@@ -4,18 +4,13 @@ import struct
 import paq
 import time
 from tqdm import tqdm
+from black_hole import reversed_chunks
 
 MAX_POSITIONS_FACTOR = 0.1  # Maximum number of positions relative to the number of chunks
 
 def reverse_chunks_in_memory(data, chunk_size, positions):
     try:
-        num_chunks = (len(data) + chunk_size - 1) // chunk_size
-        chunked_data = [data[i * chunk_size:(i + 1) * chunk_size] for i in range(num_chunks)]
-        
-        for pos in positions:
-            if 0 <= pos < len(chunked_data):
-                chunked_data[pos] = chunked_data[pos][::-1]
-        return b"".join(chunked_data)
+        return reversed_chunks(data, chunk_size, positions)
     except Exception as e:
         print(f"Error in reverse_chunks_in_memory: {e}")
         return None
@@ -2,67 +2,18 @@ import os
 import random
 import struct
 import paq
-
-# Reverse chunks at specified positions with spacing
-def reverse_chunks_at_positions(input_filename, reversed_filename, chunk_size, number_of_positions):
-    with open(input_filename, 'rb') as infile:
-        data = infile.read()
-
-    # Split into chunks
-    chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
-
-    # Add padding if needed
-    if len(chunked_data[-1]) < chunk_size:
-        chunked_data[-1] += b'\x00' * (chunk_size - len(chunked_data[-1]))
-
-    # Calculate positions with spacing between reversals
-    max_position = len(chunked_data)  # Number of chunks
-    positions = [i * (2**31) // max_position for i in range(number_of_positions)]
-
-    # Reverse specified chunks
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-
-    with open(reversed_filename, 'wb') as outfile:
-        outfile.write(b"".join(chunked_data))
+from black_hole import IOCounter, reversed_view
 
 # Compress using PAQ with metadata
-def compress_with_paq(reversed_filename, compressed_filename, chunk_size, positions, previous_size, original_size, first_attempt):
-    with open(reversed_filename, 'rb') as infile:
-        reversed_data = infile.read()
-
-    # Pack metadata (previous_size must be an integer, chunk_size and positions count as well)
+def compress_with_paq(reversed_data, chunk_size, positions, original_size):
+    # Pack metadata (chunk_size and positions count as well)
     metadata = struct.pack(">Q", original_size)  # Store the original size
     metadata += struct.pack(">I", chunk_size)  # Chunk size (as I for unsigned int)
     metadata += struct.pack(">I", len(positions))  # Number of positions (as I for unsigned int)
     metadata += struct.pack(f">{len(positions)}I", *positions)  # Positions (as a list of unsigned ints)
 
-    # Compress the file
-    compressed_data = paq.compress(metadata + reversed_data)
-
-    # Get the current compressed size
-    compressed_size = len(compressed_data)
-
-    if first_attempt:
-        # For the first attempt, we always overwrite the file, even if it's larger or equal
-        with open(compressed_filename, 'wb') as outfile:
-            outfile.write(compressed_data)
-        first_attempt = False  # After first attempt, it is no longer the first one
-        return compressed_size, first_attempt
-    elif compressed_size < previous_size:
-        # After the first attempt, we only save the smaller file
-        with open(compressed_filename, 'wb') as outfile:
-            outfile.write(compressed_data)
-        previous_size = compressed_size  # Update the previous size with the new compressed size
-        
-        # Print when compression improves
-        print(f"Improved compression with chunk size {chunk_size} and {len(positions)} reversed positions.")
-        print(f"Compression size: {compressed_size} bytes, Compression ratio: {compressed_size / original_size:.4f}")
-        
-        return previous_size, first_attempt
-    else:
-        return previous_size, first_attempt  # Do not overwrite the file if it's larger or equal
+    # Compress the data
+    return paq.compress(metadata + reversed_data)
 
 # Decompress and restore data
 def decompress_and_restore_paq(compressed_filename):
@@ -124,42 +75,56 @@ def decompress_and_restore_paq(compressed_filename):
         print("Decompression failed. The restored file does not match the original file.")
 
 # Find the best chunk strategy and keep searching infinitely (for compression)
+# The search runs in memory; each better result replaces the saved one
 def find_best_chunk_strategy(input_filename):
-    file_size = os.path.getsize(input_filename)
+    io = IOCounter()
+    data = io.read(input_filename)
+    compressed_filename = f"{input_filename}.compressed.bin"
+    file_size = len(data)
     best_chunk_size = 1  # Always set chunk size to 1
     best_positions = []
     best_compression_ratio = float('inf')
     best_count = 0
+    best_compressed_data = None
 
     previous_size = 10**12  # Use a very large number to ensure first compression happens
-    first_attempt = True  # Flag to track if it's the first attempt
-
-    while True:  # Infinite loop to keep improving
-        chunk_size = 1  # Always use chunk size 1
-        max_positions = file_size // chunk_size
-        if max_positions > 0:
-            positions_count = random.randint(1, min(max_positions, 64))
-
-            # Calculate positions with spacing between reversals
-            positions = [i * (2**31) // file_size for i in range(positions_count)]
-
-            reversed_filename = f"{input_filename}.reversed.bin"
-            reverse_chunks_at_positions(input_filename, reversed_filename, chunk_size, positions_count)
-
-            compressed_filename = f"{input_filename}.compressed.bin"
-            compressed_size, first_attempt = compress_with_paq(reversed_filename, compressed_filename, chunk_size, positions, previous_size, file_size, first_attempt)
-
-            if compressed_size < previous_size:
-                # Update the best values when a better compression ratio is found
-                previous_size = compressed_size
-                best_chunk_size = chunk_size
-                best_positions = positions
-                best_compression_ratio = compressed_size / file_size
-                best_count += 1
 
-                # Print improved compression details
-                print(f"Improved compression with chunk size {chunk_size} and {len(positions)} reversed positions.")
-                print(f"Compression size: {compressed_size} bytes, Compression ratio: {compressed_size / file_size:.4f}")
+    try:
+        while True:  # Infinite loop to keep improving, until Ctrl+C
+            chunk_size = 1  # Always use chunk size 1
+            max_positions = file_size // chunk_size
+            if max_positions > 0:
+                positions_count = random.randint(1, min(max_positions, 64))
+
+                # Calculate positions with spacing between reversals
+                positions = [i * (2**31) // file_size for i in range(positions_count)]
+
+                # Reverse specified chunks, padding the last one
+                reversed_data = reversed_view(data, chunk_size, positions, pad=True)
+                compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size)
+                compressed_size = len(compressed_data)
+
+                if compressed_size < previous_size:
+                    # Update the best values when a better compression ratio is found
+                    previous_size = compressed_size
+                    best_chunk_size = chunk_size
+                    best_positions = positions
+                    best_compression_ratio = compressed_size / file_size
+                    best_count += 1
+                    best_compressed_data = compressed_data
+
+                    # Save it now, atomically, so a kill keeps the best so far
+                    io.replace(compressed_filename, best_compressed_data)
+
+                    # Print improved compression details
+                    print(f"Improved compression with chunk size {chunk_size} and {len(positions)} reversed positions.")
+                    print(f"Compression size: {compressed_size} bytes, Compression ratio: {compressed_size / file_size:.4f}")
+    except KeyboardInterrupt:
+        print("\nSearch stopped.")
+
+    print(f"Search {io.report()}")
+    if best_compressed_data is not None:
+        print(f"Best compression saved as {compressed_filename}")
 
 # Main function
 def main():
@@ -182,7 +147,7 @@ def main():
         if not os.path.exists(input_filename):
             print(f"Error: File {input_filename} not found!")
             return
-        find_best_chunk_strategy(input_filename)  # Infinite search
+        find_best_chunk_strategy(input_filename)  # Infinite search, stop with Ctrl+C
 
     elif mode == 2:
         # Now user is prompted to enter the base name of the compressed file to extract
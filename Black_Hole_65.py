@@ -3,17 +3,12 @@ import random
 import struct
 import paq
 import time
+from black_hole import reversed_chunks, reversed_view
 
 def reverse_chunks_in_memory(data, chunk_size, positions):
     """Reverses chunks of data in memory."""
     try:
-        chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
-        if len(chunked_data[-1]) < chunk_size:
-            chunked_data[-1] += b'\x00' * (chunk_size - len(chunked_data[-1]))
-        for pos in positions:
-            if 0 <= pos < len(chunked_data):
-                chunked_data[pos] = chunked_data[pos][::-1]
-        return b"".join(chunked_data)
+        return reversed_chunks(data, chunk_size, positions, pad=True)
     except Exception as e:
         print(f"Error in reverse_chunks_in_memory: {e}")
         return None
@@ -83,7 +78,7 @@ def find_best_chunk_strategy(input_filename, timeout_seconds=60):
                 positions_count = min(max_positions, 64)
                 #More efficient position calculation
                 positions = sorted(random.sample(range(max_positions), positions_count))
-                reversed_data = reverse_chunks_in_memory(original_data, chunk_size, positions)
+                reversed_data = reversed_view(original_data, chunk_size, positions, pad=True)
                 if reversed_data and compress_with_paq(reversed_data, compressed_filename, positions, file_size):
                     compressed_size = os.path.getsize(compressed_filename)
                     compression_ratio = compressed_size / file_size
@@ -3,6 +3,7 @@ import random
 import struct
 import paq
 import time
+from black_hole import ChunkReverser
 
 def apply_minus_operation(value):
     """Applies a modified minus operation."""
@@ -39,18 +40,13 @@ def manage_leading_zeros(input_data):
 def reverse_chunks_in_memory(data, chunk_size, num_reversals, num_sets):
     """Reverses chunks of data in memory."""
     try:
-        chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
-        if len(chunked_data[-1]) < chunk_size:
-            chunked_data[-1] += b'\x00' * (chunk_size - len(chunked_data[-1]))
-
-        total_chunks = len(chunked_data)
+        reverser = ChunkReverser(data, pad=True)
+        total_chunks = -(-len(data) // chunk_size)
         for _ in range(num_reversals):
             if total_chunks > 1:
                 positions = random.sample(range(total_chunks), min(num_sets, total_chunks))
-                for pos in positions:
-                    chunked_data[pos] = chunked_data[pos][::-1]
-
-        return b"".join(chunked_data)
+                reverser.reverse(chunk_size, positions)
+        return bytes(reverser.reverse(chunk_size, []))
     except Exception as e:
         print(f"Error in reverse_chunks_in_memory: {e}")
         return None
@@ -3,6 +3,7 @@ import random
 import struct
 import time
 import paq
+from black_hole import reversed_chunks
 
 def manage_leading_zeros(input_data):
     """Strips leading zeros from byte data."""
@@ -13,17 +14,7 @@ def manage_leading_zeros(input_data):
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    
-    # Handle padding
-    padding_needed = (chunk_size - len(chunked_data[-1]) % chunk_size) % chunk_size
-    chunked_data[-1] += b'\x00' * padding_needed
-    
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions, pad=True)
 
 def add_random_bytes(data, num_bytes=4):
     """Adds random 4-byte sequences at random positions."""
@@ -1,8 +1,21 @@
 import os
-import random
 import struct
 import time
 import paq
+import sys
+from functools import partial
+
+from black_hole import (
+    ProxyScreen,
+    evaluate_candidates,
+    jobs_option,
+    proxy_options,
+    random_candidate,
+    reversed_chunks,
+    reversed_view,
+    segmented_size,
+    size_option,
+)
 
 def manage_leading_zeros(input_data):
     """Strips leading zeros from byte data."""
@@ -13,13 +26,7 @@ def manage_leading_zeros(input_data):
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    padding_needed = (chunk_size - len(chunked_data[-1]) % chunk_size) % chunk_size
-    chunked_data[-1] += b'\x00' * padding_needed
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions, pad=True)
 
 def compress_with_paq(data, chunk_size, positions, original_size):
     """Compresses data using PAQ and embeds metadata."""
@@ -48,7 +55,24 @@ def decompress_and_restore_paq(compressed_filename):
     except (FileNotFoundError, paq.PAQError, struct.error) as e:
         print(f"Decompression failed: {e}")
 
-def find_best_chunk_strategy(input_filename, max_time_seconds):
+def reverse_candidate(file_data, candidate):
+    """Returns file_data with the candidate's chunks reversed."""
+    chunk_size, positions = candidate
+    return reversed_view(file_data, chunk_size, positions, pad=True)
+
+def score_candidate(file_data, candidate):
+    """Returns the compressed size of file_data with the candidate's chunks reversed."""
+    chunk_size, positions = candidate
+    reversed_data = reverse_candidate(file_data, candidate)
+    return len(compress_with_paq(reversed_data, chunk_size, positions, len(file_data)))
+
+def score_candidate_segmented(file_data, candidate, segment_size):
+    """Returns the compressed size, recompressing only the segments the candidate changes."""
+    chunk_size, positions = candidate
+    size = segmented_size(file_data, chunk_size, positions, paq.compress, segment_size)
+    return 9 + 4 * len(positions) + size
+
+def find_best_chunk_strategy(input_filename, max_time_seconds, jobs=1, segment_size=None, proxy=None, proxy_round=32, proxy_keep=4):
     """Finds the best chunk size and reversal positions for compression."""
     try:
         with open(input_filename, 'rb') as infile:
@@ -64,22 +88,27 @@ def find_best_chunk_strategy(input_filename, max_time_seconds):
     start_time = time.time()
 
     iteration = 0
-    while time.time() - start_time < max_time_seconds:
+    draw = partial(random_candidate, file_size, min(256, file_size))
+    screen = None
+    if proxy:
+        screen = ProxyScreen(file_data, draw, reverse_candidate, proxy, proxy_round, proxy_keep)
+        draw = screen.draw
+    score = score_candidate
+    if segment_size:
+        score = partial(score_candidate_segmented, segment_size=segment_size)
+    candidates = evaluate_candidates(file_data, draw, score, max_time_seconds, jobs)
+    for candidate, compressed_size in candidates:
         iteration += 1
-        chunk_size = random.randint(1, min(256, file_size))  # Cap chunk size to file size
-        max_positions = file_size // chunk_size
-        num_positions = random.randint(0, min(max_positions, 64))  # Limit number of positions
-        positions = sorted(random.sample(range(max_positions), num_positions)) if num_positions > 0 else []
-
-        reversed_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
-        compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size)
-        compression_ratio = len(compressed_data) / file_size
+        chunk_size, positions = candidate
+        if screen:
+            screen.record(candidate, compressed_size)
+        compression_ratio = compressed_size / file_size
 
         if compression_ratio < best_compression_ratio:
             best_compression_ratio = compression_ratio
             best_chunk_size = chunk_size
             best_positions = positions
-            print(f"Improved compression: {len(compressed_data)} bytes (chunk size: {chunk_size}, positions: {positions})")
+            print(f"Improved compression: {compressed_size} bytes (chunk size: {chunk_size}, positions: {positions})")
 
     elapsed_time = time.time() - start_time
     print(f"\nBest compression achieved after {iteration} iterations (time limit: {max_time_seconds} seconds):")
@@ -87,6 +116,8 @@ def find_best_chunk_strategy(input_filename, max_time_seconds):
     print(f"Chunk size: {best_chunk_size}")
     print(f"Positions: {best_positions}")
     print(f"Time taken: {elapsed_time:.2f} seconds")
+    if screen:
+        print(screen.report())
 
     compressed_filename = f"{input_filename}.compressed.bin"
     try:
@@ -113,7 +144,7 @@ def main():
     if mode == 1:
         input_filename = input("Enter input file name to compress: ")
         max_time_seconds = int(input("Enter maximum time limit for compression (in seconds): "))
-        find_best_chunk_strategy(input_filename, max_time_seconds)
+        find_best_chunk_strategy(input_filename, max_time_seconds, jobs=jobs_option(sys.argv), segment_size=size_option(sys.argv, "--segment-size"), **proxy_options(sys.argv))
     elif mode == 2:
         compressed_filename_base = input("Enter the base name of the compressed file to extract (without .compressed.bin): ")
         compressed_filename = f"{compressed_filename_base}.compressed.bin"
@@ -3,6 +3,20 @@ import random
 import struct
 import time
 import paq
+import sys
+from functools import partial
+
+from black_hole import (
+    ProxyScreen,
+    evaluate_candidates,
+    jobs_option,
+    proxy_options,
+    random_candidate,
+    reversed_chunks,
+    reversed_view,
+    segmented_size,
+    size_option,
+)
 
 def manage_leading_zeros(input_data):
     """Strips leading zeros from byte data."""
@@ -13,13 +27,7 @@ def manage_leading_zeros(input_data):
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    padding_needed = (chunk_size - len(chunked_data[-1]) % chunk_size) % chunk_size
-    chunked_data[-1] += b'\x00' * padding_needed
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions, pad=True)
 
 def compress_with_paq(data, chunk_size, positions, original_size, strategy):
     """Compresses data using PAQ and embeds metadata, including the strategy."""
@@ -60,7 +68,32 @@ def add_random_bytes(data, num_bytes=4):
         data = data[:pos] + os.urandom(num_bytes) + data[pos:]
     return data
 
-def find_best_chunk_strategy(input_filename, max_time_seconds):
+def reverse_candidate(file_data, candidate):
+    """Returns file_data with the candidate's chunks reversed."""
+    chunk_size, positions = candidate
+    return reversed_view(file_data, chunk_size, positions, pad=True)
+
+def score_candidate(file_data, candidate):
+    """Returns the compressed sizes of both strategies for one candidate."""
+    chunk_size, positions = candidate
+    file_size = len(file_data)
+    reversed_data = reverse_candidate(file_data, candidate)
+    compressed_data_1 = compress_with_paq(reversed_data, chunk_size, positions, file_size, 0)  # strategy 0
+    modified_data_2 = add_random_bytes(bytes(reversed_data))
+    compressed_data_2 = compress_with_paq(modified_data_2, chunk_size, positions, file_size, 1)  # strategy 1
+    return len(compressed_data_1), len(compressed_data_2)
+
+def score_candidate_segmented(file_data, candidate, segment_size):
+    """Returns strategy 0's size, recompressing only the segments the candidate changes.
+
+    Strategy 1 inserts random bytes that shift everything after them, so
+    there is nothing to reuse; it is not priced in this mode.
+    """
+    chunk_size, positions = candidate
+    size = segmented_size(file_data, chunk_size, positions, paq.compress, segment_size)
+    return 10 + 4 * len(positions) + size, float("inf")
+
+def find_best_chunk_strategy(input_filename, max_time_seconds, jobs=1, segment_size=None, proxy=None, proxy_round=32, proxy_keep=4):
     """Finds the best chunk size and reversal positions for compression, automatically choosing the best strategy."""
     try:
         with open(input_filename, 'rb') as infile:
@@ -77,23 +110,23 @@ def find_best_chunk_strategy(input_filename, max_time_seconds):
     start_time = time.time()
 
     iteration = 0
-    while time.time() - start_time < max_time_seconds:
+    draw = partial(random_candidate, file_size, min(256, file_size))
+    screen = None
+    if proxy:
+        screen = ProxyScreen(file_data, draw, reverse_candidate, proxy, proxy_round, proxy_keep)
+        draw = screen.draw
+    score = score_candidate
+    if segment_size:
+        score = partial(score_candidate_segmented, segment_size=segment_size)
+    candidates = evaluate_candidates(file_data, draw, score, max_time_seconds, jobs)
+    for candidate, compressed_size in candidates:
         iteration += 1
-        chunk_size = random.randint(1, min(256, file_size))
-        max_positions = file_size // chunk_size
-        num_positions = random.randint(0, min(max_positions, 64))
-        positions = sorted(random.sample(range(max_positions), num_positions)) if num_positions > 0 else []
-
-        # Strategy 1: Basic reversal
-        reversed_data_1 = reverse_chunks_at_positions(file_data, chunk_size, positions)
-        compressed_data_1 = compress_with_paq(reversed_data_1, chunk_size, positions, file_size, 0)  # strategy 0
-        compression_ratio_1 = len(compressed_data_1) / file_size
-
-        # Strategy 2: Reversal + random bytes
-        reversed_data_2 = reverse_chunks_at_positions(file_data, chunk_size, positions)
-        modified_data_2 = add_random_bytes(reversed_data_2)
-        compressed_data_2 = compress_with_paq(modified_data_2, chunk_size, positions, file_size, 1)  # strategy 1
-        compression_ratio_2 = len(compressed_data_2) / file_size
+        chunk_size, positions = candidate
+        if screen:
+            screen.record(candidate, min(compressed_size))
+        compressed_size_1, compressed_size_2 = compressed_size
+        compression_ratio_1 = compressed_size_1 / file_size
+        compression_ratio_2 = compressed_size_2 / file_size
 
         # Choose the better strategy automatically
         if compression_ratio_1 < compression_ratio_2 and compression_ratio_1 < best_compression_ratio:
@@ -101,13 +134,13 @@ def find_best_chunk_strategy(input_filename, max_time_seconds):
             best_chunk_size = chunk_size
             best_positions = positions
             best_strategy = 0
-            print(f"Improved compression (Strategy 1): {len(compressed_data_1)} bytes (ratio: {compression_ratio_1:.4f})")
+            print(f"Improved compression (Strategy 1): {compressed_size_1} bytes (ratio: {compression_ratio_1:.4f})")
         elif compression_ratio_2 < best_compression_ratio:
             best_compression_ratio = compression_ratio_2
             best_chunk_size = chunk_size
             best_positions = positions
             best_strategy = 1
-            print(f"Improved compression (Strategy 2): {len(compressed_data_2)} bytes (ratio: {compression_ratio_2:.4f})")
+            print(f"Improved compression (Strategy 2): {compressed_size_2} bytes (ratio: {compression_ratio_2:.4f})")
 
     print(f"\nBest compression achieved after {iteration} iterations (time limit: {max_time_seconds} seconds):")
     print(f"Strategy: {best_strategy}")
@@ -115,6 +148,8 @@ def find_best_chunk_strategy(input_filename, max_time_seconds):
     print(f"Chunk size: {best_chunk_size}")
     print(f"Positions: {best_positions}")
     print(f"Time taken: {time.time() - start_time:.2f} seconds")
+    if screen:
+        print(screen.report())
 
     compressed_filename = f"{input_filename}.compressed.bin"
     try:
@@ -144,7 +179,7 @@ def main():
     if mode == 1:
         input_filename = input("Enter input file name to compress: ")
         max_time_seconds = int(input("Enter maximum time limit for compression (in seconds): "))
-        find_best_chunk_strategy(input_filename, max_time_seconds)
+        find_best_chunk_strategy(input_filename, max_time_seconds, jobs=jobs_option(sys.argv), segment_size=size_option(sys.argv, "--segment-size"), **proxy_options(sys.argv))
     elif mode == 2:
         compressed_filename = input("Enter the full name of the compressed file to extract: ")
         decompress_and_restore_paq(compressed_filename)
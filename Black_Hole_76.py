@@ -2,14 +2,11 @@ import os
 import random
 import struct
 import paq
+from black_hole import reversed_chunks, reversed_view
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions)
 
 def compress_with_paq(data, chunk_size, positions, original_size, strategy):
     """Compresses data using PAQ and embeds metadata, including the strategy."""
@@ -72,7 +69,7 @@ def find_best_chunk_strategy(input_filename, max_iterations):
         num_positions = random.randint(0, min(file_size // chunk_size, 64))
         positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
 
-        reversed_data_1 = reverse_chunks_at_positions(file_data, chunk_size, positions)
+        reversed_data_1 = reversed_view(file_data, chunk_size, positions)
         compressed_data_1 = compress_with_paq(reversed_data_1, chunk_size, positions, file_size, 0)
         compression_ratio_1 = len(compressed_data_1) / file_size
 
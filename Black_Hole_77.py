@@ -2,14 +2,11 @@ import os
 import random
 import struct
 import paq
+from black_hole import reversed_chunks, reversed_view
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions)
 
 def compress_with_paq(data, chunk_size, positions, original_size, strategy):
     """Compresses data using PAQ and embeds metadata, including the strategy."""
@@ -60,7 +57,7 @@ def find_best_iteration(input_filename, max_iterations):
         num_positions = random.randint(0, min(file_size // chunk_size, 64))
         positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
 
-        reversed_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
+        reversed_data = reversed_view(file_data, chunk_size, positions)
         compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size, 0)
         compression_ratio = len(compressed_data) / file_size
 
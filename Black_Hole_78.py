@@ -3,14 +3,11 @@ import random
 import struct
 import time
 import paq
+from black_hole import reversed_chunks, reversed_view
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions)
 
 def add_random_bytes(data, num_bytes=4):
     """Adds random 4-byte sequences at random positions."""
@@ -64,7 +61,7 @@ def find_best_iteration(input_filename, max_iterations):
         positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
 
         # Strategy 1: Reverse chunks
-        reversed_data_1 = reverse_chunks_at_positions(file_data, chunk_size, positions)
+        reversed_data_1 = reversed_view(file_data, chunk_size, positions)
         compressed_data_1 = compress_with_paq(reversed_data_1, chunk_size, positions, file_size, 1)
         compression_ratio_1 = len(compressed_data_1) / file_size
 
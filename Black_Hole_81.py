@@ -3,14 +3,11 @@ import random
 import struct
 import time
 import paq
+from black_hole import reversed_chunks, reversed_view
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions)
 
 def add_random_bytes(data, num_bytes=4):
     """Adds random 4-byte sequences at random positions."""
@@ -76,7 +73,7 @@ def find_best_iteration(input_filename, max_iterations):
 
         # Alternate strategies based on the iteration number
         if iteration % 2 == 0:  # Even iterations - Strategy 1
-            reversed_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
+            reversed_data = reversed_view(file_data, chunk_size, positions)
             compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size, 1)
             compression_ratio = len(compressed_data) / file_size
         else:  # Odd iterations - Strategy 2
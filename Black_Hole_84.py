@@ -2,13 +2,10 @@ import os
 import random
 import struct
 import paq
+from black_hole import reversed_chunks, reversed_view
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
-    chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(input_data, chunk_size, positions)
 
 def flip_2bit_pairs(data):
     modified_data = bytearray(data)
@@ -53,7 +50,7 @@ def find_best_iteration(input_filename, max_iterations):
         num_positions = random.randint(0, min(file_size // chunk_size, 64))
         positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
 
-        modified_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
+        modified_data = reversed_view(file_data, chunk_size, positions)
         modified_data = flip_2bit_pairs(modified_data)
 
         compressed_data = compress_with_paq(modified_data, chunk_size, positions, file_size)
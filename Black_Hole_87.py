@@ -2,6 +2,7 @@ import os
 import random
 import struct
 import paq
+from black_hole import reversed_chunks, reversed_view
 
 # Constants for clarity
 METADATA_HEADER_SIZE = 9  # Size of the metadata header in bytes
@@ -10,11 +11,7 @@ CALCULUS_VALUE = "2**x + 1"  # Transformation formula (example)
 
 def reverse_chunks(data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(data, chunk_size, positions)
 
 def add_random_bytes(data, num_insertions, num_bytes=1):
     """Adds random bytes at random positions."""
@@ -62,7 +59,7 @@ def find_best_iteration(input_data, max_iterations):
         chunk_size = best_chunk_size or min(128, len(input_data) // 2)  # Default to half the data length
         num_positions = random.randint(0, min(len(input_data) // chunk_size, MAX_POSITIONS))
         positions = sorted(random.sample(range(len(input_data) // chunk_size), num_positions)) if num_positions > 0 else []
-        reversed_data = reverse_chunks(input_data, chunk_size, positions)
+        reversed_data = reversed_view(input_data, chunk_size, positions)
         compressed_data = compress_data(reversed_data, chunk_size, positions, len(input_data))
         compression_ratio = len(compressed_data) / len(input_data)
         
@@ -2,17 +2,14 @@ import os
 import random
 import struct
 import paq
+from black_hole import reversed_chunks
 
 # Constants
 MAX_POSITIONS = 64  # Maximum number of chunk positions to reverse
 
 def reverse_chunks(data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
-    chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):
-            chunked_data[pos] = chunked_data[pos][::-1]
-    return b"".join(chunked_data)
+    return reversed_chunks(data, chunk_size, positions)
 
 def apply_calculus(data, calculus_value):
     """Applies bitwise transformations to each byte."""
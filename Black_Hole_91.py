@@ -1,11 +1,11 @@
 import os
-import binascii
 import math
 import random
 import heapq
 import paq
 import zlib
 import logging
+from black_hole import bytes_to_bits
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -28,11 +28,8 @@ class SmartCompressor:
     def binary_to_file(self, binary_data, filename):
         try:
             n = int(binary_data, 2)
-            num_bytes = (len(binary_data) + 7) // 8
-            hex_str = "%0*x" % (num_bytes * 2, n)
-            if len(hex_str) % 2 != 0:
-                hex_str = '0' + hex_str
-            byte_data = binascii.unhexlify(hex_str)
+            num_bytes = max((len(binary_data) + 7) // 8, (n.bit_length() + 7) // 8)
+            byte_data = n.to_bytes(num_bytes, "big")
             with open(filename, 'wb') as f:
                 f.write(byte_data)
             return True
@@ -47,8 +44,7 @@ class SmartCompressor:
                 if not data:
                     logging.error("Error: Empty file")
                     return None
-                binary_str = bin(int(binascii.hexlify(data), 16))[2:]
-                return binary_str.zfill(len(data) * 8)
+                return bytes_to_bits(data)
         except Exception as e:
             logging.error(f"Error reading file: {str(e)}")
             return None
@@ -0,0 +1,38 @@
+"""Shared building blocks for the Black_Hole engines."""
+
+from .bits import BitBuffer, bits_to_bytes, bytes_to_bits, pad_left, stored
+from .candidates import CandidateTable
+from .checkpoint import Checkpoint, pack_bits, unpack_bits
+from .chunk_search import (
+    PROXIES,
+    ProxyScreen,
+    evaluate_candidates,
+    proxy_options,
+    random_candidate,
+)
+from .encoder import En_space_rule, encode_tokens, mark_runs, six_zeros_rule
+from .engine import (
+    SEED_WINDOW,
+    BitEngine,
+    Black_Hole_4,
+    Black_Hole_34,
+    Black_Hole_39,
+    Black_Hole_46,
+    black_hole_1,
+)
+from .fileio import IOCounter
+from .formula import HoleNumber, hole_step
+from .interactive import run_interactive
+from .options import count_option, jobs_option, size_option
+from .paq_engines import PAQ_ENGINES, PaqEngine
+from .parallel import CandidateSearch
+from .prefilter import TargetFilter
+from .quantum import circuit_diagnostic
+from .raw import copy_stored, is_stored
+from .registry import ENGINES, Engine, engine_names, get_engine, register
+from .reversal import ChunkReverser, reversed_chunks, reversed_view
+from .segments import SegmentedScorer, segmented_size
+from .stream import MAX_BLOCK_SIZE, compress_stream, extract_stream, is_stream
+from .sweep import ONE_STEP_LIMIT, sweep_k2, sweep_search
+from .tokens import TokenScanner
+from .university import decode_university
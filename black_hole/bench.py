@@ -0,0 +1,109 @@
+"""Timings for the engines' hot loops.
+
+    python -m black_hole.bench loop [--start K2] [--count N]
+    python -m black_hole.bench decode [--start K2] [--count N]
+
+``loop`` runs the body of the Black_Hole_26 search loop (split ``k2`` into
+its fields, one ``process_files`` step, the ``counts`` update) and prints the
+iterations per second, once as the loop runs now and once with the two
+``QuantumCircuit`` constructions it used to make on every ``k2``, if
+qiskit is installed.
+
+``decode`` times ``decode_university`` against the string slicing it
+replaced, on the same ``University``/``X2`` pairs the loop would see.
+"""
+
+import sys
+from time import perf_counter
+
+from .formula import hole_step
+from .options import count_option
+from .quantum import universe_qubits
+from .university import decode_university
+
+
+def loop_iterations(start, count, QuantumCircuit=None):
+    """Run *count* iterations of the search loop from ``k2 = start``.
+
+    With *QuantumCircuit*, build the circuits the loop used to build.
+    Returns ``counts`` so the work cannot be skipped.
+    """
+    counts = -1
+    for k2 in range(start, start + count):
+        X1 = k2 + 1
+        if QuantumCircuit is not None:
+            QuantumCircuit(universe_qubits(k2))
+            QuantumCircuit(k2)
+        Divide, Times_12, Multiply, Add_Numbers, Deep5, Multiply_Times = (
+            decode_university(k2, X1)
+        )
+        Multiply = Multiply or 1
+        Number = hole_step(Multiply_Times, Deep5, Add_Numbers, Multiply)
+        if counts == -1:
+            counts = 0
+        elif Number != Multiply_Times:
+            counts += 1
+    return counts
+
+
+def rate(start, count, QuantumCircuit=None):
+    """Return iterations per second of ``loop_iterations``."""
+    began = perf_counter()
+    loop_iterations(start, count, QuantumCircuit)
+    return count / (perf_counter() - began)
+
+
+def bench_loop(argv):
+    start = count_option(argv, "--start", 0)
+    count = count_option(argv, "--count", 2000, 1)
+    print("k2 from %d, %d iterations" % (start, count))
+    print("  without circuits: %12.0f it/s" % rate(start, count))
+    try:
+        from qiskit import QuantumCircuit
+    except ImportError:
+        print("  with circuits:    qiskit is not installed")
+        return
+    print("  with circuits:    %12.0f it/s" % rate(start, count, QuantumCircuit))
+
+
+def slice_university(University, X2):
+    """The fields as the loops used to cut them out of a string."""
+    C11 = "0" + str((8 * X2) + 40) + "b"
+    University_file = format(University, C11)
+    return (
+        int(University_file[0 : (X2 * 8)], 2),
+        int(University_file[(X2 * 8) : (X2 * 8) + 8], 2),
+        int(University_file[(X2 * 8) + 8 : (X2 * 8) + 16], 2),
+        int(University_file[(X2 * 8) + 16 : (X2 * 8) + 24], 2),
+        int(University_file[(X2 * 8) + 24 : (X2 * 8) + 32], 2),
+        int(University_file[(X2 * 8) + 32 : (X2 * 8) + 40], 2),
+    )
+
+
+def bench_decode(argv):
+    start = count_option(argv, "--start", 0)
+    count = count_option(argv, "--count", 2000, 1)
+    print("k2 from %d, %d decodes" % (start, count))
+    for name, decode in (
+        ("string slicing", slice_university),
+        ("decode_university", decode_university),
+    ):
+        began = perf_counter()
+        for k2 in range(start, start + count):
+            decode(k2, k2 + 1)
+        print("  %-18s %12.0f /s" % (name + ":", count / (perf_counter() - began)))
+
+
+BENCHMARKS = {"loop": bench_loop, "decode": bench_decode}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in BENCHMARKS:
+        names = ",".join(BENCHMARKS)
+        raise SystemExit("usage: python -m black_hole.bench {%s} ..." % names)
+    BENCHMARKS[argv[0]](argv[1:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Packed bit buffers for the bit-string engines.
+
+Black_Hole_1/4/34/39/46 used to carry every intermediate stream as a Python
+``str`` of ``"0"``/``"1"`` characters.  ``BitBuffer`` keeps the same MSB-first
+bit order packed eight bits to a byte, with an append cursor for the encoder
+and a read cursor for the token loops.
+
+Engines that still work on the text form convert at their edges with
+``bytes_to_bits`` and ``bits_to_bytes``, which go through ``int.from_bytes``
+and ``int.to_bytes`` rather than hex text and a zero-padding loop.
+"""
+
+import binascii
+
+# Bytes moved per step when bits are copied across a byte boundary, so a
+# copy never turns the whole stream into one Python int.
+COPY_CHUNK = 1 << 16
+
+
+class BitBuffer:
+    """MSB-first bit string packed into a ``bytearray``.
+
+    Whole bytes live in ``data``; up to seven trailing bits wait in an
+    integer accumulator until they fill a byte, so appending costs O(width)
+    and the buffer never holds more than one byte per eight bits.
+    """
+
+    __slots__ = ("data", "pos", "_tail", "_tail_bits")
+
+    def __init__(self, data=b""):
+        self.data = bytearray(data)
+        self.pos = 0
+        self._tail = 0
+        self._tail_bits = 0
+
+    @classmethod
+    def from_int(cls, value, width):
+        """Build a buffer holding the low *width* bits of *value*."""
+        buf = cls()
+        buf.write(value, width)
+        return buf
+
+    @classmethod
+    def from_str(cls, bits):
+        """Build a buffer from a ``"0"``/``"1"`` string."""
+        if not bits:
+            return cls()
+        return cls.from_int(int(bits, 2), len(bits))
+
+    def __len__(self):
+        return (len(self.data) << 3) + self._tail_bits
+
+    def __eq__(self, other):
+        if not isinstance(other, BitBuffer):
+            return NotImplemented
+        return (
+            self._tail_bits == other._tail_bits
+            and self._tail == other._tail
+            and self.data == other.data
+        )
+
+    def __repr__(self):
+        return "BitBuffer(%d bits)" % len(self)
+
+    def copy(self):
+        buf = BitBuffer(self.data)
+        buf._tail = self._tail
+        buf._tail_bits = self._tail_bits
+        return buf
+
+    def write(self, value, width):
+        """Append the low *width* bits of *value*."""
+        if width <= 0:
+            return
+        acc = (self._tail << width) | (value & ((1 << width) - 1))
+        bits = self._tail_bits + width
+        rest = bits & 7
+        if bits >= 8:
+            self.data += (acc >> rest).to_bytes(bits >> 3, "big")
+            acc &= (1 << rest) - 1
+        self._tail = acc
+        self._tail_bits = rest
+
+    def write_padded(self, value, width):
+        """Append *value* zero-padded to at least *width* bits.
+
+        Matches ``format(value, "0<width>b")``: a value wider than *width*
+        is written in full rather than truncated.
+        """
+        self.write(value, max(width, value.bit_length(), 1))
+
+    def extend(self, other):
+        """Append every bit of another ``BitBuffer``."""
+        if not self._tail_bits:
+            self.data += other.data
+        else:
+            data = other.data
+            for start in range(0, len(data), COPY_CHUNK):
+                chunk = data[start : start + COPY_CHUNK]
+                self.write(int.from_bytes(chunk, "big"), len(chunk) << 3)
+        self.write(other._tail, other._tail_bits)
+
+    def get(self, start, width):
+        """Return *width* bits starting at bit *start* as an ``int``."""
+        if width <= 0:
+            return 0
+        end = start + width
+        if start < 0 or end > len(self):
+            raise IndexError("bit range out of buffer")
+        first = start >> 3
+        if end <= len(self.data) << 3:
+            last = (end + 7) >> 3
+            chunk = int.from_bytes(self.data[first:last], "big")
+            return (chunk >> ((last << 3) - end)) & ((1 << width) - 1)
+        # The range reaches into the pending tail bits.
+        chunk = (
+            int.from_bytes(self.data[first:], "big") << self._tail_bits
+        ) | self._tail
+        return (chunk >> (len(self) - end)) & ((1 << width) - 1)
+
+    def seek(self, pos):
+        self.pos = pos
+
+    def read(self, width):
+        """Read *width* bits at the cursor and advance past them."""
+        value = self.get(self.pos, width)
+        self.pos += width
+        return value
+
+    def slice(self, start, stop=None):
+        """Return bits ``[start:stop]`` as a new buffer."""
+        size = len(self)
+        if stop is None or stop > size:
+            stop = size
+        if start >= stop:
+            return BitBuffer()
+        if not start & 7 and stop == size:
+            buf = BitBuffer(self.data[start >> 3 :])
+            buf._tail = self._tail
+            buf._tail_bits = self._tail_bits
+            return buf
+        buf = BitBuffer()
+        step = COPY_CHUNK << 3
+        for pos in range(start, stop, step):
+            width = min(step, stop - pos)
+            buf.write(self.get(pos, width), width)
+        return buf
+
+    def to_int(self):
+        return (int.from_bytes(self.data, "big") << self._tail_bits) | self._tail
+
+    def to_bytes(self):
+        """Pack into whole bytes, left-padding a partial leading byte.
+
+        This is what ``binascii.unhexlify("%0Nx" % int(bits, 2))`` produced
+        for the byte-aligned streams the engines write.
+        """
+        if not self._tail_bits:
+            return bytes(self.data)
+        return self.to_int().to_bytes((len(self) + 7) >> 3, "big")
+
+    def to_str(self):
+        """Unpack into the ``"0"``/``"1"`` text form used by the decoders."""
+        size = len(self)
+        if not size:
+            return ""
+        return format(self.to_int(), "0%db" % size)
+
+
+def stored(bits):
+    """Prefix *bits* with the ``"00000000"`` stored-raw marker."""
+    buf = BitBuffer(b"\x00")
+    buf.extend(bits)
+    return buf
+
+
+def pad_left(bits):
+    """Left-pad *bits* with ``8 - len % 8`` zero bits.
+
+    That is the engines' container rule: one to eight zero bits, so an
+    already byte-aligned stream still gains a whole zero byte in front of
+    its leading ``"1"``.
+    """
+    buf = BitBuffer()
+    buf.write(0, 8 - len(bits) % 8)
+    buf.extend(bits)
+    return buf
+
+
+def bytes_to_bits(data):
+    """Return *data* as ``"0"``/``"1"`` text, eight characters per byte.
+
+    This is ``bin(int(binascii.hexlify(data), 16))[2:]`` followed by the
+    loop that put back the leading zeros ``bin`` drops, one at a time.
+    """
+    if not data:
+        return ""
+    return format(int.from_bytes(data, "big"), "0%db" % (len(data) * 8))
+
+
+def bits_to_bytes(bits):
+    """``binascii.unhexlify("%0Nx" % int(bits, 2))``, N = ``len(bits) // 8 * 2``.
+
+    The value is packed with ``int.to_bytes`` instead.  As before, a value
+    too wide for N digits keeps its own width, and one needing an odd
+    number of hex digits raises ``binascii.Error``.  *bits* may also be a
+    ``BitBuffer``, packed by the same rule.
+    """
+    if isinstance(bits, BitBuffer):
+        if not len(bits):
+            raise ValueError("invalid literal for int() with base 2: ''")
+        value = bits.to_int()
+    else:
+        value = int(bits, 2)
+    digits = max(len(bits) // 8 * 2, (value.bit_length() + 3) // 4, 1)
+    if digits % 2:
+        raise binascii.Error("Odd-length string")
+    return value.to_bytes(digits // 2, "big")
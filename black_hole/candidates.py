@@ -0,0 +1,50 @@
+"""Bookkeeping for the En search.
+
+The Find loop used to append ``"En=..., Longl_F=... / "`` records to a
+string and re-parse it with ``re.findall`` whenever it grew past 100
+characters.  ``CandidateTable`` keeps the running minimum as integers
+instead, with the same tie-break: among equal lengths the candidate
+recorded first wins.
+"""
+
+from array import array
+
+
+class CandidateTable:
+    """Running minimum of ``(En, Longl_F)`` candidates.
+
+    With ``keep=True`` every candidate is also kept, in the order it was
+    added, for diagnostics; see ``table``.
+    """
+
+    def __init__(self, keep=False):
+        self._best = None
+        self._ens = array("q") if keep else None
+        self._lengths = array("q") if keep else None
+
+    def __len__(self):
+        return 0 if self._ens is None else len(self._ens)
+
+    def add(self, En, Longl_F):
+        if self._best is None or Longl_F < self._best[1]:
+            self._best = En, Longl_F
+        if self._ens is not None:
+            self._ens.append(En)
+            self._lengths.append(Longl_F)
+
+    def best(self):
+        """Return the smallest ``(En, Longl_F)`` so far, or None."""
+        return self._best
+
+    def table(self):
+        """Return every candidate as ``(En, Longl_F)`` rows.
+
+        A two-column ``numpy`` array when NumPy is installed, otherwise a
+        list of tuples.  Empty unless the table was built with ``keep``.
+        """
+        rows = list(zip(self._ens or (), self._lengths or ()))
+        try:
+            import numpy as np
+        except ImportError:
+            return rows
+        return np.array(rows, dtype=np.int64).reshape(-1, 2)
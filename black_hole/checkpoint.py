@@ -0,0 +1,137 @@
+"""Checkpoints for the long searches, resumed with ``--resume``.
+
+The k2 sweep of Black_Hole_26/56 and the Circle passes of Black_Hole_34/39
+can run for hours.  ``Checkpoint`` keeps their state in ``NAME.ckpt``
+next to the input: a few counters and byte strings (the best stream so
+far) in a small binary record::
+
+    "BHck"  version  engine  digest[16]  n_counters  n_blobs
+    counters as signed 64-bit ints
+    each blob as a 64-bit length and its bytes
+    CRC-32 of everything before it
+
+all little-endian.  The digest is of the input file, so a checkpoint is
+only picked up by a run on the same data and the same engine; a torn or
+foreign file is ignored rather than trusted.  Each save goes to a
+temporary file that is then renamed over the old one, so a crash leaves
+either the old record or the new one.
+"""
+
+import hashlib
+import os
+import struct
+import zlib
+from time import time
+
+from .bits import BitBuffer
+
+MAGIC = b"BHck"
+VERSION = 1
+
+# Saves closer together than this are skipped unless forced.
+CHECKPOINT_SECONDS = 30
+
+_HEADER = struct.Struct("<4sBB16sBB")
+_LENGTH = struct.Struct("<Q")
+_CRC = struct.Struct("<I")
+
+
+def input_digest(data):
+    """Return the 16-byte digest that ties a checkpoint to its input."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def pack_bits(bits):
+    """Return ``BitBuffer`` *bits* as bytes for a checkpoint blob."""
+    return bytes((bits._tail_bits, bits._tail)) + bytes(bits.data)
+
+
+def unpack_bits(blob):
+    """Rebuild the ``BitBuffer`` that ``pack_bits`` packed."""
+    bits = BitBuffer(blob[2:])
+    bits.write(blob[1], blob[0])
+    return bits
+
+
+class Checkpoint:
+    """The checkpoint file of engine number *engine* for input *name*.
+
+    *data* is the input, for the digest.  ``save`` writes at most once per
+    *every* seconds; the first write waits that long too, so short runs
+    never leave a file behind.
+    """
+
+    def __init__(self, name, data, engine, every=CHECKPOINT_SECONDS):
+        self.path = name + ".ckpt"
+        self.digest = input_digest(data)
+        self.engine = engine
+        self.every = every
+        self._last = time()
+
+    def save(self, counters, blobs=(), force=False):
+        """Record *counters* (ints) and *blobs* (bytes); True if written."""
+        now = time()
+        if not force and now - self._last < self.every:
+            return False
+        record = bytearray(
+            _HEADER.pack(
+                MAGIC, VERSION, self.engine, self.digest, len(counters), len(blobs)
+            )
+        )
+        record += struct.pack("<%dq" % len(counters), *counters)
+        for blob in blobs:
+            record += _LENGTH.pack(len(blob))
+            record += blob
+        record += _CRC.pack(zlib.crc32(record))
+        temp = self.path + ".tmp"
+        with open(temp, "wb") as f:
+            f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.path)
+        self._last = now
+        return True
+
+    def load(self):
+        """Return ``(counters, blobs)`` from the file, or None.
+
+        None also covers a file left by another input or engine and one
+        that does not check out.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                record = f.read()
+        except OSError:
+            return None
+        if len(record) < _HEADER.size + _CRC.size:
+            return None
+        body, crc = record[: -_CRC.size], record[-_CRC.size :]
+        if _CRC.unpack(crc)[0] != zlib.crc32(body):
+            return None
+        magic, version, engine, digest, n_counters, n_blobs = _HEADER.unpack_from(
+            body
+        )
+        if (magic, version, engine, digest) != (
+            MAGIC,
+            VERSION,
+            self.engine,
+            self.digest,
+        ):
+            return None
+        pos = _HEADER.size
+        counters = struct.unpack_from("<%dq" % n_counters, body, pos)
+        pos += 8 * n_counters
+        blobs = []
+        for _ in range(n_blobs):
+            (size,) = _LENGTH.unpack_from(body, pos)
+            pos += _LENGTH.size
+            blobs.append(body[pos : pos + size])
+            pos += size
+        return counters, blobs
+
+    def remove(self):
+        """Delete the file once the search it covers is over."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
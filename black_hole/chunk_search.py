@@ -0,0 +1,267 @@
+"""Candidate search for the paq chunk-reversal engines (Black_Hole_71-75).
+
+``find_best_chunk_strategy`` draws random ``(chunk_size, positions)``
+candidates, reverses those chunks and prices the result with one
+``paq.compress`` call, until its time budget runs out.  Each call keeps
+one core busy and nothing else, so ``evaluate_candidates`` scores the
+candidates on *jobs* worker processes at once: the script still draws
+every candidate and keeps the best itself, but the results come back as
+they finish, and a budget of T seconds prices about *jobs* times as many.
+The input reaches each worker once, when the pool starts.
+
+Most candidates are plainly no better than the best so far, and
+``ProxyScreen`` keeps them away from paq: it draws a round of candidates,
+prices each with a cheap proxy (zlib level 1, or an order-1 entropy
+estimate), and hands only the *keep* best of the round on to be scored.
+Its report sets each round's proxy ranks against the paq sizes that came
+back, which is what *keep* should be tuned on.
+"""
+
+import math
+import random
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, wait
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; order1_bits falls back to a Counter.
+    np = None
+
+from .options import count_option, option_value
+from .parallel import process_pool
+
+# Candidates queued per worker, so none sits idle while the script reads
+# a result and draws the next candidate.
+CANDIDATES_PER_JOB = 2
+
+# The input of the search this worker process scores candidates for.
+_worker_data = None
+
+
+def random_candidate(file_size, max_chunk_size=256, max_positions=64):
+    """Draw ``(chunk_size, positions)`` the way the engines' loops do.
+
+    The chunk size is 1 to *max_chunk_size*; up to *max_positions* of the
+    whole chunks of a *file_size*-byte input are picked, in order.
+    """
+    chunk_size = random.randint(1, max_chunk_size)
+    chunks = file_size // chunk_size
+    num_positions = random.randint(0, min(chunks, max_positions))
+    if num_positions > 0:
+        positions = sorted(random.sample(range(chunks), num_positions))
+    else:
+        positions = []
+    return chunk_size, positions
+
+
+def _start_worker(data):
+    global _worker_data
+    _worker_data = data
+    # Forked workers would otherwise share the parent's random state.
+    random.seed()
+
+
+def _score(score, candidate):
+    return score(_worker_data, candidate)
+
+
+def evaluate_candidates(data, draw, score, max_time_seconds, jobs=1):
+    """Yield ``(candidate, score(data, candidate))`` until time runs out.
+
+    *draw* is called for each new candidate.  Candidates are drawn for
+    *max_time_seconds* from the call; with *jobs* above 1 they are scored
+    on that many processes and yielded in the order they finish, and
+    results still running at the deadline are dropped.  *score* must be a
+    module-level function so the workers can find it.  Leaving the loop
+    early stops the search.
+    """
+    deadline = time.time() + max_time_seconds
+    if jobs <= 1:
+        while time.time() < deadline:
+            candidate = draw()
+            yield candidate, score(data, candidate)
+        return
+    pool = process_pool(jobs, _start_worker, (data,))
+    pending = {}
+    try:
+        while True:
+            while len(pending) < jobs * CANDIDATES_PER_JOB:
+                if time.time() >= deadline:
+                    break
+                candidate = draw()
+                pending[pool.submit(_score, score, candidate)] = candidate
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            done, _ = wait(pending, remaining, FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def zlib_size(data):
+    """Proxy: the size of *data* after zlib at level 1."""
+    return len(zlib.compress(data, 1))
+
+
+def order1_bits(data):
+    """Proxy: the order-1 entropy of *data* in bits, each byte given the last.
+
+    Order 0 would not do: reversing chunks leaves the byte counts alone.
+    """
+    if len(data) < 2:
+        return 8 * len(data)
+    if np is not None:
+        view = np.frombuffer(data, dtype=np.uint8).astype(np.int64)
+        pairs = np.bincount((view[:-1] << 8) | view[1:], minlength=1 << 16)
+        pairs = pairs.reshape(256, 256)
+        contexts = pairs.sum(axis=1, keepdims=True)
+        nonzero = pairs > 0
+        ratios = np.broadcast_to(contexts, pairs.shape)[nonzero] / pairs[nonzero]
+        return float((pairs[nonzero] * np.log2(ratios)).sum())
+    pairs = Counter(zip(data, data[1:]))
+    contexts = Counter(data[:-1])
+    return sum(
+        count * math.log2(contexts[pair[0]] / count) for pair, count in pairs.items()
+    )
+
+
+PROXIES = {"zlib": zlib_size, "order1": order1_bits}
+
+
+def _rank_correlation(xs, ys):
+    """Spearman's rho of two equal-length lists, or None if it is undefined."""
+
+    def ranks(values):
+        order = sorted(range(len(values)), key=values.__getitem__)
+        result = [0.0] * len(values)
+        k = 0
+        while k < len(order):
+            end = k
+            while end + 1 < len(order) and values[order[end + 1]] == values[order[k]]:
+                end += 1
+            for j in range(k, end + 1):
+                result[order[j]] = (k + end) / 2
+            k = end + 1
+        return result
+
+    if len(xs) < 2:
+        return None
+    rx, ry = ranks(xs), ranks(ys)
+    mean = (len(xs) - 1) / 2
+    cov = sum((a - mean) * (b - mean) for a, b in zip(rx, ry))
+    vx = sum((a - mean) ** 2 for a in rx)
+    vy = sum((b - mean) ** 2 for b in ry)
+    if not vx or not vy:
+        return None
+    return cov / math.sqrt(vx * vy)
+
+
+class ProxyScreen:
+    """Pre-screen candidates from *draw* on a cheap proxy before paq.
+
+    ``screen.draw`` replaces *draw* for ``evaluate_candidates``: it draws
+    *round_size* candidates, prices ``proxy(transform(data, candidate))``
+    for each and returns the *keep* lowest, best first, before drawing the
+    next round.  Pass each paq result back with ``record(candidate,
+    size)``; ``report()`` then tells how the proxy ranks held up.
+    """
+
+    def __init__(self, data, draw, transform, proxy="zlib", round_size=32, keep=4):
+        if proxy not in PROXIES:
+            raise ValueError(
+                "unknown proxy %r; use one of %s" % (proxy, ", ".join(PROXIES))
+            )
+        self.data = data
+        self._draw = draw
+        self.transform = transform
+        self.proxy = proxy
+        self.round_size = round_size
+        self.keep = min(keep, round_size)
+        self.rounds = 0
+        self.drawn = 0
+        self.proxy_seconds = 0.0
+        self._queue = []
+        # id(candidate) -> (candidate, round, proxy rank, proxy score) until
+        # its paq size is recorded; then round -> [(rank, score, size)].
+        self._sent = {}
+        self._scored = {}
+
+    def draw(self):
+        if not self._queue:
+            self._next_round()
+        candidate, rank, score = self._queue.pop(0)
+        self._sent[id(candidate)] = candidate, self.rounds, rank, score
+        return candidate
+
+    def _next_round(self):
+        began = time.time()
+        price = PROXIES[self.proxy]
+        priced = []
+        for _ in range(self.round_size):
+            candidate = self._draw()
+            priced.append((price(self.transform(self.data, candidate)), candidate))
+        self.proxy_seconds += time.time() - began
+        priced.sort(key=lambda item: item[0])
+        self.rounds += 1
+        self.drawn += self.round_size
+        self._queue = [
+            (candidate, rank, score)
+            for rank, (score, candidate) in enumerate(priced[: self.keep])
+        ]
+
+    def record(self, candidate, size):
+        """Note the paq *size* of a candidate that ``draw`` handed out."""
+        sent = self._sent.pop(id(candidate), None)
+        if sent is None:
+            return
+        candidate, round_number, rank, score = sent
+        self._scored.setdefault(round_number, []).append((rank, score, size))
+
+    def report(self):
+        """Proxy rank against paq size, to tune *keep* and *round_size*."""
+        scored = [row for rows in self._scored.values() for row in rows]
+        lines = [
+            "proxy %s: %d rounds, %d candidates drawn, %d scored by paq, "
+            "%.2fs on the proxy"
+            % (self.proxy, self.rounds, self.drawn, len(scored), self.proxy_seconds)
+        ]
+        # Which proxy rank gave the smallest paq size, over complete rounds.
+        winners = Counter(
+            min(rows, key=lambda row: (row[2], row[0]))[0]
+            for rows in self._scored.values()
+            if len(rows) == self.keep
+        )
+        if winners:
+            lines.append(
+                "  round winner by proxy rank: "
+                + ", ".join(
+                    "#%d %d" % (rank + 1, winners[rank]) for rank in range(self.keep)
+                )
+            )
+        rho = _rank_correlation([row[1] for row in scored], [row[2] for row in scored])
+        if rho is not None:
+            lines.append("  rank correlation of proxy and paq size: %.3f" % rho)
+        return "\n".join(lines)
+
+
+def proxy_options(argv):
+    """``--proxy NAME``, ``--proxy-round N`` and ``--proxy-keep K`` from *argv*.
+
+    Returns keywords for ``find_best_chunk_strategy``; without ``--proxy``
+    the search sends every candidate to paq.
+    """
+    proxy = option_value(argv, "--proxy")
+    if proxy is not None and proxy not in PROXIES:
+        names = ", ".join(PROXIES)
+        raise SystemExit("--proxy takes one of %s, got %r" % (names, proxy))
+    return {
+        "proxy": proxy,
+        "proxy_round": count_option(argv, "--proxy-round", 32, 1),
+        "proxy_keep": count_option(argv, "--proxy-keep", 4, 1),
+    }
@@ -0,0 +1,187 @@
+"""``blackhole``: compress or extract many files without prompts.
+
+    blackhole compress [--engine NAME] [--jobs N] [--param KEY=VALUE] PATH...
+    blackhole extract [--engine NAME] [--jobs N] PATH...
+
+Each PATH is a file or a directory, walked recursively.  ``compress``
+writes the file plus the engine's suffix (``.b``, or ``.compressed.bin``
+for the paq engines 57-89) next to each file, skipping ``.b``,
+``.compressed.bin`` and ``.ckpt`` files in directories; ``extract`` takes
+the files with that suffix and writes them back without it, the same
+names the Black_Hole_N scripts use.  *--engine* is a name from
+black_hole.registry, *--param* passes a keyword to the engine's
+``compress`` (``--param passes=8``, ``--param En_number=12`` for engine 1,
+``--param max_time_seconds=10`` for the paq engines).  With ``--jobs N``
+the files are done on N processes.
+
+One line is printed per file as it finishes, with its sizes and seconds,
+then a summary.  The exit status is 1 if any file failed.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import as_completed
+from time import perf_counter
+
+from .parallel import process_pool
+from .registry import engine_names, get_engine
+
+SKIPPED_SUFFIXES = (".b", ".compressed.bin", ".ckpt")
+
+
+def input_files(paths, command, suffix=".b"):
+    """Yield the files *command* works on, from files and directories.
+
+    *suffix* is the engine's: ``extract`` takes the files ending in it.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if command == "extract":
+                    wanted = name.endswith(suffix)
+                else:
+                    wanted = not name.endswith(SKIPPED_SUFFIXES)
+                if wanted:
+                    yield os.path.join(root, name)
+
+
+def output_name(path, command, suffix=".b"):
+    if command == "compress":
+        return path + suffix
+    if not path.endswith(suffix):
+        raise ValueError("%s does not end in %s" % (path, suffix))
+    return path[: -len(suffix)]
+
+
+def process_file(command, engine_name, path, params):
+    """Compress or extract one file; return ``(output, in, out, seconds)``."""
+    began = perf_counter()
+    engine = get_engine(engine_name)
+    output = output_name(path, command, engine.suffix)
+    with open(path, "rb") as src:
+        data = src.read()
+    if command == "compress":
+        result = engine.compress(data, **params)
+    else:
+        result = engine.extract(data)
+    with open(output, "wb") as dst:
+        dst.write(result)
+    return output, len(data), len(result), perf_counter() - began
+
+
+def param_value(text):
+    """``KEY=VALUE`` as ``(key, value)``, VALUE as an int where it is one."""
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError("expected KEY=VALUE, got %r" % text)
+    try:
+        return key, int(value)
+    except ValueError:
+        return key, value
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="blackhole", description="Compress or extract files in bulk."
+    )
+    parser.add_argument("command", choices=("compress", "extract"))
+    parser.add_argument("paths", nargs="+", metavar="PATH")
+    parser.add_argument("--engine", default="34", choices=engine_names())
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="files done at once; 0 means every CPU"
+    )
+    parser.add_argument(
+        "--param",
+        type=param_value,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="keyword for the engine's compress",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+    if args.command == "extract" and args.param:
+        parser.error("--param only applies to compress")
+    return args
+
+
+def _results(args, paths):
+    """Yield ``(path, result or exception)`` as the files finish."""
+    params = dict(args.param)
+    if args.jobs == 1 or len(paths) <= 1:
+        for path in paths:
+            try:
+                yield path, process_file(args.command, args.engine, path, params)
+            except Exception as error:
+                yield path, error
+        return
+    pool = process_pool(min(args.jobs, len(paths)))
+    futures = {}
+    try:
+        futures = {
+            pool.submit(process_file, args.command, args.engine, path, params): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as error:
+                yield futures[future], error
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown()
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    suffix = get_engine(args.engine).suffix
+    paths = list(input_files(args.paths, args.command, suffix))
+    if not paths:
+        raise SystemExit("blackhole: no files to %s" % args.command)
+    began = perf_counter()
+    done = failed = size_in = size_out = 0
+    work = 0.0
+    for path, result in _results(args, paths):
+        done += 1
+        prefix = "[%d/%d] %s" % (done, len(paths), path)
+        if isinstance(result, Exception):
+            failed += 1
+            print("%s: failed: %s" % (prefix, result))
+            continue
+        output, n_in, n_out, seconds = result
+        size_in += n_in
+        size_out += n_out
+        work += seconds
+        print(
+            "%s -> %s  %d -> %d bytes  %.3fs" % (prefix, output, n_in, n_out, seconds)
+        )
+    ratio = 100.0 * size_out / size_in if size_in else 0.0
+    print(
+        "%s: %d files with engine %s, %d failed; %d -> %d bytes (%.1f%%); "
+        "%.3fs, %.3fs of work"
+        % (
+            args.command,
+            len(paths) - failed,
+            args.engine,
+            failed,
+            size_in,
+            size_out,
+            ratio,
+            perf_counter() - began,
+            work,
+        )
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Compression passes shared by the bit-string engines.
+
+These are the W3/W4 repeated-byte marker pass and the En-width token
+pass from ``cryptograpy_compression4``, rewritten over ``BitBuffer`` so a
+pass is linear in the input and never builds ``"0"``/``"1"`` text.  The
+bit layout they emit is the one the engines' decoders already read.  With
+NumPy the run search works on a view of the buffer's bytes instead of a
+loop over 8-bit tokens.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the run search falls back to a loop.
+    np = None
+
+from .bits import BitBuffer
+
+
+# The rules use ``&`` rather than ``and`` so that *zeros* may also be a
+# NumPy array of per-token counts (see black_hole.tokens).
+
+
+def six_zeros_rule(En, zeros):
+    """Black_Hole_1/34/39/46: six or more zeros and ``En < 2 ** (zeros - 4)``."""
+    return (zeros >= 6) & (zeros - 4 >= En.bit_length())
+
+
+def En_space_rule(En, zeros):
+    """Black_Hole_4: more zeros than it takes to write ``En``, plus three."""
+    return zeros > En.bit_length() + 3
+
+
+def _scan_runs(bits, min_run):
+    padded = bits.copy()
+    padded.write(0, 8)
+    total = len(padded)
+
+    def token(k):
+        start = k << 3
+        if start >= total:
+            return None
+        width = min(8, total - start)
+        return padded.get(start, width), width
+
+    count = 0
+    first = 0
+    nxt = None
+    for k in range((total + 7) >> 3):
+        cur = token(k)
+        if count == 0:
+            nxt = token(k + 1)
+        if nxt == cur:
+            count += 1
+            if count == 1:
+                first = k
+        elif count >= min_run:
+            return first, count, nxt[0]
+        else:
+            count = 0
+    return None
+
+
+# Tokens the NumPy run search looks at in one go.
+RUN_BLOCK = 1 << 16
+
+
+def _scan_runs_np(bits, min_run):
+    # The 8-bit tokens of bits + "00000000".  A partial last token (the
+    # sentinel's spill-over, always zero) is coded above 255 so that it
+    # matches no full token, as the (value, width) compare in the loop.
+    if bits._tail_bits:
+        tail = [bits._tail << (8 - bits._tail_bits), 256 + bits._tail_bits]
+    else:
+        tail = [0]
+    data = np.frombuffer(bits.data, dtype=np.uint8)
+    tail = np.array(tail, dtype=np.int16)
+    total = len(data) + len(tail)
+    # The tokens are searched a block at a time.  A block ends before its
+    # last segment of equal tokens, which may run on into the next block,
+    # and *lost* carries whether that segment loses its first token.
+    start = 0
+    lost_next = False
+    size = RUN_BLOCK
+    while True:
+        stop = min(start + size, total)
+        tokens = data[start:stop].astype(np.int16)
+        if stop > len(data):
+            tokens = np.concatenate((tokens, tail[max(start - len(data), 0) :]))
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(tokens)) + 1))
+        lengths = np.diff(np.append(starts, len(tokens)))
+        final = stop == total
+        if not final:
+            if len(starts) == 1:
+                size *= 2
+                continue
+            starts = starts[:-1]
+            lengths = lengths[:-1]
+        # The loop only notices a run has ended on the token after it, and
+        # that token cannot open the next run.  So a segment of equal tokens
+        # loses its first token whenever the one before it kept two or more;
+        # a segment of one resets that, longer ones set it and each segment
+        # of exactly two flips it.  A segment of 3 or 1 stands in for the
+        # ones before this block.
+        lengths = np.concatenate(([3 if lost_next else 1], lengths))
+        index = np.arange(len(lengths))
+        last = np.maximum.accumulate(np.where(lengths != 2, index, -1))
+        prev = np.concatenate(([-1], last[:-1]))
+        base = (prev >= 0) & (lengths[np.maximum(prev, 0)] >= 3)
+        lost = base ^ ((index - 1 - prev) & 1).astype(bool)
+        lengths, lost = lengths[1:], lost[1:]
+        counts = lengths - lost
+        # A run that reaches the end of the stream is never closed.
+        hits = np.flatnonzero(counts[:-1] >= min_run if final else counts >= min_run)
+        if len(hits):
+            k = hits[0]
+            first = start + int(starts[k] + lost[k])
+            return first, int(counts[k]), int(tokens[starts[k]])
+        if final:
+            return None
+        if lengths[-1] == 2:
+            lost_next = not lost[-1]
+        else:
+            lost_next = bool(lengths[-1] >= 3)
+        start += int(lengths.sum())
+        size = RUN_BLOCK
+
+
+def mark_runs(bits, min_run=3):
+    """Collapse the first run of *min_run* or more repeated bytes.
+
+    The stream is scanned in 8-bit steps with an ``"00000000"`` sentinel
+    appended, exactly like the W3/W4 loop it replaces.  Returns
+    ``(stream, marker)`` where *marker* is the prefix that was put in front
+    of the data: ``"1"`` when no run was found, otherwise ``"0"`` + the run
+    byte + the 5-bit-sized position and count fields.
+    """
+    if np is None:
+        run = _scan_runs(bits, min_run)
+    else:
+        run = _scan_runs_np(bits, min_run)
+
+    marker = BitBuffer()
+    if run is None:
+        marker.write(1, 1)
+        stream = marker.copy()
+        stream.extend(bits)
+        return stream, marker
+
+    first, count, value = run
+    marker.write(0, 1)
+    marker.write(value, 8)
+    marker.write_padded(max(first.bit_length(), 1), 5)
+    marker.write_padded(first, 1)
+    marker.write_padded(count.bit_length(), 5)
+    marker.write_padded(count, 1)
+    # Keep one copy of the run byte; the decoder re-inserts count - 1.
+    stream = marker.copy()
+    stream.extend(bits.slice(0, first << 3))
+    stream.extend(bits.slice((first + count - 1) << 3))
+    return stream, marker
+
+
+def encode_tokens(bits, En, rule):
+    """Re-encode *bits* as a sequence of En-bit tokens.
+
+    A token whose leading zeros satisfy *rule* becomes ``"011"`` + zero
+    count + significant bits, a token starting ``"01"`` becomes ``"010"`` +
+    its remaining bits, anything else is copied.  Returns
+    ``(TUPLE, C1_width, longl)``: the encoded stream, the zero-count field
+    width (0 if no token was rewritten) and the length of the last token.
+    """
+    out = BitBuffer()
+    width = En.bit_length()
+    size = len(bits)
+    C1_width = 0
+    longl = 0
+    bits.seek(0)
+    while bits.pos < size:
+        longl = min(En, size - bits.pos)
+        value = bits.read(longl)
+        length = value.bit_length() or 1
+        zeros = En - length
+        if rule(En, zeros) or (longl >= 3 and value >> (longl - 2) == 1):
+            C1_width = width
+            if zeros != 1:
+                out.write(3, 3)
+                out.write_padded(zeros, width)
+                out.write(value, length)
+            else:
+                out.write(2, 3)
+                out.write(value, longl - 2)
+        else:
+            out.write(value, longl)
+    return out, C1_width, longl
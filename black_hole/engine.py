@@ -0,0 +1,502 @@
+"""The Circle pipeline of the bit-string engines as callable functions.
+
+``cryptograpy_compression4`` in Black_Hole_4/34/39/46 reads a file, runs
+Circle passes (W3 run marker, En search, En-width tokens) until they stop
+paying, decodes its own output as a check and writes either the container
+or the ``"00000000"`` stored copy.  ``BitEngine`` runs the same pipeline on
+``bytes`` so it can be applied to pieces of a file (see black_hole.stream).
+
+The decoder is the engines' own, quirks included: a ``"011"`` token skips
+En extra bits (except in Black_Hole_46) and a ``"010"`` last token is
+rebuilt from every ``"01"`` seen so far.  The self-check means such
+streams are simply stored, and keeping the decoder as it is keeps
+``extract`` able to read ``.b`` files the scripts wrote.  It reads the
+packed ``BitBuffer`` through ``_BitText``, which slices it the way the
+decoder sliced its ``"0"``/``"1"`` text, so neither ``extract`` nor the
+self-check ever holds a character per bit.
+"""
+
+from functools import lru_cache
+
+from .bits import BitBuffer, bits_to_bytes, pad_left, stored
+from .candidates import CandidateTable
+from .checkpoint import pack_bits, unpack_bits
+from .encoder import En_space_rule, encode_tokens, mark_runs, six_zeros_rule
+from .tokens import TokenScanner
+
+# Candidates either side of the previous pass's En that a later Circle
+# pass prices before falling back to the full search.
+SEED_WINDOW = 256
+
+
+class DecodeFallback(Exception):
+    """The decoder hit one of the engines' give-up checks.
+
+    When compressing, the engines then keep the stored copy; when
+    extracting, they write the ``.b`` file's own bytes back out.
+    """
+
+
+class _BitText:
+    """A ``"0"``/``"1"`` string the decoder reads, kept packed.
+
+    It is bits ``[start:start + size]`` of a ``BitBuffer``.  ``field`` and
+    ``tail`` take ``str`` slice bounds, negative or past the end included,
+    so the decoder's index arithmetic behaves as it did on text.
+    """
+
+    __slots__ = ("buf", "start", "size")
+
+    def __init__(self, buf, start=0, size=None):
+        self.buf = buf
+        self.start = start
+        self.size = len(buf) - start if size is None else size
+
+    def __len__(self):
+        return self.size
+
+    def field(self, start, stop=None):
+        """``s[start:stop]`` as ``(value, width)``."""
+        start, stop, _ = slice(start, stop).indices(self.size)
+        width = max(stop - start, 0)
+        return self.buf.get(self.start + start, width), width
+
+    def int_at(self, start, stop=None):
+        """``int(s[start:stop], 2)``, which rejects an empty slice."""
+        value, width = self.field(start, stop)
+        if not width:
+            raise ValueError("invalid literal for int() with base 2: ''")
+        return value
+
+    def tail(self, start):
+        """``s[start:]``."""
+        start = slice(start, None).indices(self.size)[0]
+        return _BitText(self.buf, self.start + start, self.size - start)
+
+    def to_buffer(self, start=0, stop=None):
+        """``s[start:stop]`` as a new ``BitBuffer``."""
+        start, stop, _ = slice(start, stop).indices(self.size)
+        return self.buf.slice(self.start + start, self.start + max(start, stop))
+
+
+def _first_one(buf):
+    """Index of the first 1 bit in *buf*, or ``len(buf)`` if there is none."""
+    for i, byte in enumerate(buf.data):
+        if byte:
+            return (i << 3) + 8 - byte.bit_length()
+    if buf._tail:
+        return len(buf) - buf._tail.bit_length()
+    return len(buf)
+
+
+def _repeat(value, width, count):
+    """A ``BitBuffer`` of the *width*-bit *value* written *count* times."""
+    if count <= 0 or width <= 0:
+        return BitBuffer()
+    if width == 8:
+        return BitBuffer(bytes((value,)) * count)
+    ones = ((1 << (width * count)) - 1) // ((1 << width) - 1)
+    return BitBuffer.from_int(value * ones, width * count)
+
+
+class BitEngine:
+    """One variant of the bit-string engine.
+
+    *run_min* is the shortest byte run the W3/W4 pass marks, *rule* decides
+    which tokens are rewritten, *overhead* is added to a candidate's length
+    before comparing it with the input.  *row_stop*, *En_wrap* and
+    *circle_cap* are the Find loop's ``Row`` limit, the En value that wraps
+    back to 256 and the largest ``Circle_times``.  With *sized_header* En
+    and the pass count are written with a 5-bit length prefix (Black_Hole_4)
+    instead of in fixed 15- and 8-bit fields (Black_Hole_34).  With
+    *keep_marker* a pass whose run marking found a run and did not grow
+    the stream keeps only the marker, less its last 8 bits, as
+    Black_Hole_46 does; the self-check then stores such inputs.  Its
+    decoder reads a ``"011"`` token without the En bits the others skip
+    after it, which *skip_011* turns off.
+    """
+
+    def __init__(
+        self,
+        name,
+        run_min,
+        rule,
+        overhead,
+        row_stop,
+        En_wrap,
+        circle_cap,
+        sized_header,
+        keep_marker=False,
+        skip_011=True,
+    ):
+        self.name = name
+        self.run_min = run_min
+        self.rule = rule
+        self.overhead = overhead
+        self.row_stop = row_stop
+        self.En_wrap = En_wrap
+        self.circle_cap = circle_cap
+        self.sized_header = sized_header
+        self.keep_marker = keep_marker
+        self.skip_011 = skip_011
+        # Widest longl field the decoder will look for.
+        self.longl_limit = 29 if sized_header else 16
+
+    def __repr__(self):
+        return "<BitEngine %s>" % self.name
+
+    def candidates(self):
+        """The En values the Find loop visits before it wraps."""
+        return range(3, min(self.row_stop + 3, self.En_wrap + 1))
+
+    def find_En(self, scanner, long_11):
+        """Run the Find loop over *scanner*; return ``(En, C1_len)``.
+
+        *long_11* is the size the pass has to beat: bytes on the first
+        pass, bits (and so compared times eight, as in the scripts) after.
+        """
+        Find = 0
+        En = 3
+        Row = 0
+        C1_len = 0
+        candidates = CandidateTable()
+        while Find != 1:
+            Longl_F, C1_width, longl = scanner.encoded_length(En, self.rule)
+            if C1_width:
+                C1_len = C1_width
+            if Find == 2 or Row == self.row_stop:
+                Find = 1
+            elif Row == self.row_stop - 1 and Find == 3:
+                best = candidates.best()
+                if best:
+                    En, Longl_F = best
+                    Find = 2
+            elif (
+                Longl_F + self.overhead + C1_len < long_11 * 8
+                and C1_len != 0
+            ):
+                candidates.add(En, Longl_F)
+                Find = 3
+                En, Row = self._count_adds(En, Row)
+            else:
+                En, Row = self._count_adds(En, Row)
+        return En, C1_len
+
+    def seeded_En(self, scanner, long_11, seed, window, search=None):
+        """Run the Find loop over the *window* candidates either side of *seed*.
+
+        A later Circle pass usually settles near the En the previous one
+        picked, so it starts there instead of at 3.  Inside the window the
+        Find loop's rules hold: the shortest candidate that beats *long_11*
+        wins, ties go to the smaller En, and C1_len is taken from the last
+        rewriting candidate before it is re-read for the winner.  Returns
+        ``(En, C1_len)``, or None when no candidate in the window qualifies
+        and the pass needs the full search.
+        """
+        Ens = self.candidates()
+        Ens = range(
+            max(Ens.start, seed - window), min(Ens.stop, seed + window + 1)
+        )
+        if search is not None:
+            search.prefetch(scanner, Ens, self.rule)
+        C1_len = 0
+        candidates = CandidateTable()
+        for En in Ens:
+            Longl_F, C1_width, longl = scanner.encoded_length(En, self.rule)
+            if C1_width:
+                C1_len = C1_width
+            if Longl_F + self.overhead + C1_len < long_11 * 8 and C1_len != 0:
+                candidates.add(En, Longl_F)
+        best = candidates.best()
+        if best is None:
+            return None
+        En = best[0]
+        C1_width = scanner.encoded_length(En, self.rule)[1]
+        return En, C1_width or C1_len
+
+    def _count_adds(self, En, Row):
+        Row += 1
+        if Row == self.En_wrap:
+            Row = 0
+        if En == self.En_wrap:
+            En = 255
+        return En + 1, Row
+
+    def _write_count(self, buf, value, width):
+        if self.sized_header:
+            buf.write_padded(value.bit_length(), 5)
+            buf.write_padded(value, 1)
+        else:
+            buf.write(value, width)
+
+    def _read_count(self, bits, width):
+        if self.sized_header:
+            width = bits.int_at(0, 5)
+            bits = bits.tail(5)
+        return bits.int_at(0, width), bits.tail(width)
+
+    def compress(
+        self,
+        data,
+        search=None,
+        passes=None,
+        seed_window=SEED_WINDOW,
+        checkpoint=None,
+        resume=False,
+    ):
+        """Compress *data* the way the engine's ``i == 1`` path does.
+
+        Returns the bytes the script would write to ``name + ".b"``.
+        *search* is an optional ``CandidateSearch`` to run the En search
+        on a process pool.  *passes* caps the Circle passes below the
+        engine's own limit.  Passes after the first search *seed_window*
+        candidates around the previous En first (see ``seeded_En``); with
+        ``seed_window=0`` every pass runs the full search, as the scripts
+        did.  With a ``Checkpoint`` the state is saved after each pass that
+        does not end the loop, and with *resume* the passes pick up from
+        the saved state if there is one for this *data*.
+        """
+        if not data:
+            raise ValueError("nothing to compress")
+        cap = self.circle_cap if passes is None else min(passes, self.circle_cap)
+        original = BitBuffer(data)
+        INFO = original
+        long_11 = len(data)
+        Circle_times = 0
+        Circle_times2 = 1
+        INFOS = None
+        En = None
+        resumed = resume and checkpoint is not None and checkpoint.load()
+        if resumed:
+            counters, blobs = resumed
+            Circle_times, Circle_times2, long_11, En = counters
+            INFO, INFOS = map(unpack_bits, blobs)
+        while True:
+            long_before = len(INFO)
+            INFO, W5 = mark_runs(INFO, self.run_min)
+            if self.keep_marker and W5.get(0, 1) == 0 and len(INFO) <= long_before:
+                INFO = W5.slice(0, len(W5) - 8)
+            scanner = TokenScanner(INFO)
+            found = None
+            if En is not None and seed_window:
+                found = self.seeded_En(scanner, long_11, En, seed_window, search)
+            if found is None:
+                if search is not None:
+                    search.prefetch(scanner, self.candidates(), self.rule)
+                found = self.find_En(scanner, long_11)
+            En, C1_len = found
+            TUPLE, C1_width, longl = encode_tokens(INFO, En, self.rule)
+            Circle_times += 1
+            INFO = BitBuffer()
+            self._write_count(INFO, En, 15)
+            INFO.write_padded(longl, C1_len)
+            INFO.extend(TUPLE)
+            if Circle_times == 1:
+                Circle_times2 = Circle_times
+                long_11 = long_11 * 8
+            if len(TUPLE) <= long_11 or Circle_times == cap:
+                long_11 = len(TUPLE)
+                INFOS = INFO
+                Circle_times2 = Circle_times
+            if (
+                len(TUPLE) > long_11
+                or Circle_times > Circle_times2 + 1
+                or Circle_times == cap
+            ):
+                break
+            if checkpoint is not None:
+                counters = Circle_times, Circle_times2, long_11, En
+                checkpoint.save(counters, (pack_bits(INFO), pack_bits(INFOS)))
+        if checkpoint is not None:
+            checkpoint.remove()
+        container = BitBuffer.from_int(1, 1)
+        self._write_count(container, Circle_times2, 8)
+        container.extend(INFO if Circle_times == 1 else INFOS)
+        container = pad_left(container)
+        try:
+            limit = 4 * len(original) + 1024
+            verified = self.decode(container, limit) == original
+        except Exception:
+            # The script dies here, after already writing the stored copy.
+            verified = False
+        if not verified:
+            return stored(original).to_bytes()
+        if container.get(0, 8) == 0:
+            container = container.slice(8)
+        return container.to_bytes()
+
+    def extract(self, data, limit=None):
+        """Decode a ``.b`` file the way the engine's ``i == 2`` path does.
+
+        *limit*, if given, is the most bits a decoded pass may hold.
+        """
+        if data[:1] == b"\x00":
+            return bytes(data[1:])
+        try:
+            return bits_to_bytes(self.decode(BitBuffer(data), limit))
+        except DecodeFallback:
+            return bytes(data)
+
+    def decode(self, bits, limit=None):
+        """Undo the Circle passes of the container in ``BitBuffer`` *bits*.
+
+        Returns the decoded ``BitBuffer``.  Raises ``DecodeFallback`` where
+        the engines give up, and where a run would grow a pass past *limit*
+        bits: the scripts build such a run one byte at a time and never
+        finish.
+        """
+        # Leading zeros, then the "1" in front of the pass count.
+        INFO = _BitText(bits).tail(_first_one(bits) + 1)
+        Circle_times4, INFO = self._read_count(INFO, 8)
+        Circle_times = 0
+        # ZEROS_ONE_1, the last token's bits, as "01" * ones_01 + last.
+        ones_01 = 0
+        last = (0, 0)
+        longl = SEN = SiZeros_ones = C9 = None
+        while True:
+            En, INFO = self._read_count(INFO, 15)
+            for i in range(3, self.longl_limit):
+                if En <= (2 ** i) - 1:
+                    longl = INFO.int_at(0, i)
+                    INFO = INFO.tail(i)
+                    SEN = i
+                    break
+            TUPLE = BitBuffer()
+            block = 0
+            while block < len(INFO):
+                C9 = 0
+                O, O_width = INFO.field(block, block + 3)
+                if O_width == 3 and O == 0b010:
+                    block += 3
+                    E, OC_width = INFO.field(block, block + En - 2)
+                    if OC_width == 0:
+                        raise DecodeFallback("short 010 token")
+                    C9 = 1
+                    TUPLE.write(0b01, 2)
+                    TUPLE.write_padded(E, En - 2)
+                    ones_01 += 1
+                    block += En - 2
+                elif O_width == 3 and O == 0b011:
+                    block += 3
+                    if En <= self.En_wrap:
+                        SiZeros_ones = INFO.int_at(block, block + SEN)
+                        block += SEN
+                    E = INFO.field(block, block + (En - SiZeros_ones))[0]
+                    block += En - SiZeros_ones
+                    TUPLE.write_padded(E, En)
+                    ones_01, last = 0, (E, max(longl, E.bit_length(), 1))
+                    if self.skip_011:
+                        block += En
+                else:
+                    E = INFO.int_at(block, block + En)
+                    block += En
+                    TUPLE.write_padded(E, En)
+                    ones_01, last = 0, (E, max(longl, E.bit_length(), 1))
+            if C9 is None:
+                raise ValueError("no tokens to decode")
+            long_L = len(TUPLE)
+            cut = En if C9 == 0 else En - 2
+            if long_L - cut >= 0:
+                TUPLE = TUPLE.slice(0, long_L - cut)
+                TUPLE.extend(_repeat(0b01, 2, ones_01))
+                TUPLE.write(*last)
+            INFO = self._unmark_runs(TUPLE, limit)
+            Circle_times += 1
+            if Circle_times == Circle_times4:
+                return INFO.to_buffer()
+
+    @staticmethod
+    def _unmark_runs(Z, limit=None):
+        """Undo ``mark_runs`` on a decoded pass; return it as ``_BitText``."""
+        Z = _BitText(Z)
+        if not len(Z):
+            return Z
+        if Z.field(0, 1)[0] == 1:
+            return Z.tail(1)
+        E2 = Z.field(1, 9)
+        block = 9
+        E3 = Z.int_at(block, block + 5)
+        block += 5
+        if Z.field(block, block + E3)[1] == 0:
+            raise DecodeFallback("short run position")
+        E1 = Z.int_at(block, block + E3)
+        block += E3
+        TUPLE4 = Z.int_at(block, block + 5)
+        block += 5
+        E5 = Z.int_at(block, block + TUPLE4)
+        block += TUPLE4
+        if limit is not None and len(Z) + 8 * (E5 - 1) > limit:
+            raise DecodeFallback("run longer than the data")
+        rest = Z.tail(block)
+        E1 *= 8
+        out = rest.to_buffer(0, E1)
+        out.extend(_repeat(E2[0], E2[1], E5 - 1))
+        out.extend(rest.to_buffer(E1))
+        return _BitText(out)
+
+
+Black_Hole_4 = BitEngine(
+    "4",
+    run_min=3,
+    rule=En_space_rule,
+    overhead=0,
+    row_stop=(2 ** 15) - 2,
+    En_wrap=(2 ** 28) - 1,
+    circle_cap=(2 ** 24) - 1,
+    sized_header=True,
+)
+
+Black_Hole_34 = BitEngine(
+    "34",
+    run_min=3,
+    rule=six_zeros_rule,
+    overhead=8 + 13 + 8,
+    row_stop=(8192 * 4) - 2,
+    En_wrap=(8192 * 4) - 1,
+    circle_cap=255,
+    sized_header=False,
+)
+
+Black_Hole_39 = BitEngine(
+    "39",
+    run_min=4,
+    rule=six_zeros_rule,
+    overhead=8 + 13 + 8,
+    row_stop=(8192 * 4) - 2,
+    En_wrap=(8192 * 4) - 1,
+    circle_cap=255,
+    sized_header=False,
+)
+
+Black_Hole_46 = BitEngine(
+    "46",
+    run_min=3,
+    rule=six_zeros_rule,
+    overhead=8 + 13 + 8,
+    row_stop=(8192 * 4) - 2,
+    En_wrap=(8192 * 4) - 1,
+    circle_cap=255,
+    sized_header=False,
+    keep_marker=True,
+    skip_011=False,
+)
+
+
+@lru_cache(maxsize=None)
+def black_hole_1(En_number=15):
+    """Black_Hole_1, whose Find loop stops after ``2**En_number - 2`` rows.
+
+    The script asks for *En_number* ("points of the intersections") and
+    keeps it within 2 to 28.  Extracting does not depend on it.
+    """
+    En_number = min(max(En_number, 2), 28)
+    return BitEngine(
+        "1",
+        run_min=3,
+        rule=six_zeros_rule,
+        overhead=0,
+        row_stop=(2 ** En_number) - 2,
+        En_wrap=(2 ** 28) - 1,
+        circle_cap=(2 ** 24) - 1,
+        sized_header=True,
+    )
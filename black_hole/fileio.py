@@ -0,0 +1,54 @@
+"""Whole-file reads and writes, counted.
+
+The chunk searches of Black_Hole_1.4, 1.5.1 and 64 wrote every candidate
+to a temporary file and read it back before compressing it.  They now
+read the input once, search on it in memory, and write only their
+output; the files they do touch go through an ``IOCounter``, whose
+report after the search shows the writes it made.  A search that runs
+until it is stopped saves its best output with ``replace`` each time it
+improves, so a kill never leaves a half-written file.
+"""
+
+import os
+
+
+class IOCounter:
+    """Read and write whole files, counting the calls and the bytes."""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def read(self, path):
+        with open(path, "rb") as src:
+            data = src.read()
+        self.reads += 1
+        self.bytes_read += len(data)
+        return data
+
+    def write(self, path, data):
+        with open(path, "wb") as dst:
+            dst.write(data)
+        self.writes += 1
+        self.bytes_written += len(data)
+
+    def replace(self, path, data):
+        """Write *data* to a temporary file beside *path*, then rename it."""
+        tmp = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            self.write(tmp, data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def report(self):
+        return "I/O: %d reads (%d bytes), %d writes (%d bytes)" % (
+            self.reads,
+            self.bytes_read,
+            self.writes,
+            self.bytes_written,
+        )
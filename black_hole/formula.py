@@ -0,0 +1,151 @@
+"""The formula step of the search engines (Black_Hole_26/27/28/56).
+
+``process_files`` turns a number into ``((N * (2**Deep - 1) + Add) // 3) *
+Multiply`` and the search compares the result with the whole file read as
+one integer.  Building ``2**Deep - 1`` and then multiplying by it costs a
+full-width product per step, and in Black_Hole_56, where ``N`` is first
+raised to ``2**Square_Root_26_1024_1024``, every step is megabytes wide.
+
+``hole_step`` uses ``(N << Deep) - N`` instead of the product.  A result
+wider than ``EAGER_BITS`` comes back as a ``HoleNumber``, which keeps the
+formula rather than the digits.  Its low 64 bits, its residue modulo the
+``int`` hash modulus and bounds on its bit length follow from the formula
+in a few word operations, so comparing it with the file or with the
+previous step rejects a mismatch without ever writing the number out; the
+digits are only built when every check agrees.
+"""
+
+import sys
+
+# Results up to this many bits are returned as plain ints.
+EAGER_BITS = 1 << 16
+
+_MASK = (1 << 64) - 1
+_INV3 = 0xAAAAAAAAAAAAAAAB  # 3 * _INV3 == 1 modulo 2**64
+_MODULUS = sys.hash_info.modulus  # hash(n) == n % _MODULUS for n >= 0
+_INV3_MOD = pow(3, _MODULUS - 2, _MODULUS)
+
+
+def square_root_times(Number, Deep, Key=1):
+    """``Number * Square_of_ROOT``, where Square_of_ROOT is ``2**Deep - 1``.
+
+    As in ``process_files``, Square_of_ROOT is raised to *Key* when it is
+    smaller.
+    """
+    if Deep < 1 or (1 << Deep) - 1 <= Key:
+        return Number * Key
+    return (Number << Deep) - Number
+
+
+def hole_step(Number, Deep, Add_Numbers, Multiply, Key=1, shift=0):
+    """One ``process_files`` step on ``Number << shift``; see the module doc.
+
+    *Number* may itself be a ``HoleNumber``; callers only pass small ones,
+    since ``process_files`` clamps anything wider before the step.
+    """
+    head = square_root_times(int(Number), Deep, Key)
+    if (
+        shift < 64
+        or head.bit_length() + shift <= EAGER_BITS
+        or head <= 0
+        or Add_Numbers < 0
+        or Multiply < 1
+    ):
+        return (((head << shift) + Add_Numbers) // 3) * Multiply
+    return HoleNumber(head, shift, Add_Numbers, Multiply)
+
+
+class HoleNumber:
+    """``(((head << shift) + Add_Numbers) // 3) * Multiply``, not evaluated.
+
+    Compares and hashes like the int it stands for.  *head* must be
+    positive, *shift* at least 64 and the other fields non-negative and
+    below ``2**64``; ``hole_step`` evaluates anything else straight away.
+    """
+
+    __slots__ = ("head", "shift", "Add_Numbers", "Multiply", "low", "residue")
+
+    def __init__(self, head, shift, Add_Numbers, Multiply):
+        self.head = head
+        self.shift = shift
+        self.Add_Numbers = Add_Numbers
+        self.Multiply = Multiply
+        # X = (head << shift) + Add_Numbers is at least 2**shift, so X // 3
+        # is (X - X % 3) / 3, and dividing by 3 is multiplying by its
+        # inverse both modulo 2**64 and modulo the (prime) hash modulus.
+        r = (head * pow(2, shift, 3) + Add_Numbers) % 3
+        low = ((head << shift) & _MASK if shift < 64 else 0) + Add_Numbers - r
+        self.low = ((low & _MASK) * _INV3 * Multiply) & _MASK
+        x = head * pow(2, shift, _MODULUS) + Add_Numbers - r
+        self.residue = x % _MODULUS * _INV3_MOD % _MODULUS * Multiply % _MODULUS
+
+    def __repr__(self):
+        return "HoleNumber(%d bits)" % self.bit_length()
+
+    def __int__(self):
+        X = (self.head << self.shift) + self.Add_Numbers
+        return (X // 3) * self.Multiply
+
+    __index__ = __int__
+
+    def __format__(self, spec):
+        return format(int(self), spec)
+
+    def __hash__(self):
+        return self.residue
+
+    def bit_range(self):
+        """Return ``(low, high)`` bounds on ``int(self).bit_length()``."""
+        width = self.head.bit_length() + self.shift
+        m = self.Multiply.bit_length()
+        return width + m - 3, width + m - 1
+
+    def bit_length(self):
+        low, high = self.bit_range()
+        if low == high:
+            return low
+        return int(self).bit_length()
+
+    def _may_equal(self, other):
+        if isinstance(other, HoleNumber):
+            low, high = other.bit_range()
+            low_bits, residue = other.low, other.residue
+        else:
+            low = high = other.bit_length()
+            low_bits, residue = other & _MASK, other % _MODULUS
+        mine = self.bit_range()
+        return (
+            low <= mine[1]
+            and high >= mine[0]
+            and low_bits == self.low
+            and residue == self.residue
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, (int, HoleNumber)):
+            return NotImplemented
+        if other is self:
+            return True
+        if not self._may_equal(other):
+            return False
+        return int(self) == int(other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __lt__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        if other <= 0:
+            return False
+        low, high = self.bit_range()
+        if other.bit_length() < low:
+            return False
+        if other.bit_length() > high:
+            return True
+        return int(self) < other
+
+    def __ge__(self, other):
+        less = self.__lt__(other)
+        return less if less is NotImplemented else not less
@@ -0,0 +1,95 @@
+"""The prompt-driven command line of the bit-string engine scripts.
+
+Black_Hole_1/4/34/39/46 each ran the same dialogue: ask for a file name,
+compress it to ``name + ".b"`` or, for a name ending in ``.b``, extract it
+back to the name without the suffix, and print the seconds it took.  The
+scripts now only say which ``BitEngine`` to use and call
+``run_interactive``; the work itself is ``BitEngine.compress``/``extract``,
+the same functions the registry (black_hole.registry) hands out.
+
+Flags, read from *argv* beside the prompts:
+
+``--jobs N``          En search and streamed blocks on N processes
+``--passes N``        at most N Circle passes
+``--seed-window N``   candidates around the last En a pass tries first
+``--block-size SIZE`` write a streamed ``.b`` file of SIZE blocks
+``--resume``          continue from the ``.ckpt`` file of an interrupted run
+"""
+
+import os
+import sys
+from time import time
+
+from .checkpoint import Checkpoint
+from .engine import SEED_WINDOW
+from .options import count_option, jobs_option, size_option
+from .parallel import CandidateSearch
+from .raw import copy_stored, is_stored
+from .stream import MAX_BLOCK_SIZE, compress_stream, extract_stream, is_stream
+
+
+def run_interactive(engine, ask_engine=None, seed_window=SEED_WINDOW, argv=None):
+    """Ask for a file and compress or extract it with *engine*.
+
+    *ask_engine*, if given, is called when compressing to ask for any
+    further settings and returns the engine to use instead.  *seed_window*
+    is the default for ``--seed-window``.  Returns the elapsed seconds as
+    a string, which the scripts print.
+    """
+    argv = sys.argv if argv is None else argv
+    with CandidateSearch(jobs_option(argv)) as search:
+        return _run(engine, ask_engine, seed_window, argv, search)
+
+
+def _run(engine, ask_engine, seed_window, argv, search):
+    passes = count_option(argv, "--passes", None, 1)
+    seed_window = count_option(argv, "--seed-window", seed_window)
+    block_size = size_option(argv, "--block-size", MAX_BLOCK_SIZE)
+    name = input("What is name of file input? ")
+    extracting = name[-2:] == ".b"
+    if not extracting and ask_engine is not None:
+        engine = ask_engine()
+    if os.path.exists(name):
+        print("Path is exists!")
+    else:
+        print("Path is not exists!")
+        raise SystemExit
+    x = time()
+    if extracting:
+        with open(name, "rb") as src, open(name[:-2], "wb") as f2:
+            if is_stream(name):
+                extract_stream(engine, src, f2, search.jobs)
+            elif is_stored(name):
+                copy_stored(src, f2)
+            else:
+                f2.write(engine.extract(src.read()))
+        return str(time() - x)
+    if block_size:
+        with open(name, "rb") as src, open(name + ".b", "wb") as f2:
+            compress_stream(
+                engine,
+                src,
+                f2,
+                block_size,
+                search.jobs,
+                passes=passes,
+                seed_window=seed_window,
+            )
+        return str(time() - x)
+    with open(name, "rb") as src:
+        data = src.read()
+    if len(data) > MAX_BLOCK_SIZE:
+        print("print file is too big!")
+        raise SystemExit
+    checkpoint = Checkpoint(name, data, int(engine.name))
+    packed = engine.compress(
+        data,
+        search,
+        passes,
+        seed_window,
+        checkpoint,
+        "--resume" in argv,
+    )
+    with open(name + ".b", "wb") as f2:
+        f2.write(packed)
+    return str(time() - x)
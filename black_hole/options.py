@@ -0,0 +1,60 @@
+"""Command-line options shared by the engine scripts.
+
+The scripts take their file name from ``input()``; these helpers pick the
+few optional flags out of ``sys.argv`` without disturbing that.
+"""
+
+import os
+
+
+def option_value(argv, flag):
+    """Return the value of ``flag VALUE`` or ``flag=VALUE``, or None."""
+    for k, arg in enumerate(argv):
+        if arg == flag and k + 1 < len(argv):
+            return argv[k + 1]
+        if arg.startswith(flag + "="):
+            return arg[len(flag) + 1 :]
+    return None
+
+
+def jobs_option(argv):
+    """Return N from ``--jobs N``, default 1; ``--jobs 0`` means every CPU."""
+    value = option_value(argv, "--jobs")
+    if value is None:
+        return 1
+    if value == "0":
+        return os.cpu_count() or 1
+    if not value.isdigit():
+        raise SystemExit("--jobs takes a number, got %r" % value)
+    return int(value)
+
+
+_SIZE_SUFFIXES = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def size_option(argv, flag, limit=None):
+    """Return a byte count such as ``4096``, ``64K`` or ``16M``, or None."""
+    value = option_value(argv, flag)
+    if value is None:
+        return None
+    scale = _SIZE_SUFFIXES.get(value[-1:].upper(), 1)
+    digits = value[:-1] if scale > 1 else value
+    if not digits.isdigit() or int(digits) == 0:
+        raise SystemExit("%s takes a size in bytes, got %r" % (flag, value))
+    size = int(digits) * scale
+    if limit is not None and size > limit:
+        raise SystemExit("%s can be at most %d bytes" % (flag, limit))
+    return size
+
+
+def count_option(argv, flag, default, low=0, high=None):
+    """Return N from ``flag N``, default *default*, checked against the bounds."""
+    value = option_value(argv, flag)
+    if value is None:
+        return default
+    if not value.isdigit():
+        raise SystemExit("%s takes a number, got %r" % (flag, value))
+    count = int(value)
+    if count < low or (high is not None and count > high):
+        raise SystemExit("%s must be %d to %s" % (flag, low, high or "any size"))
+    return count
@@ -0,0 +1,260 @@
+"""The paq chunk-reversal engines (Black_Hole_57-89) on ``bytes``.
+
+Each of these scripts draws random ``(chunk_size, positions)`` candidates,
+reverses those chunks, puts a small header in front and keeps the
+candidate ``paq.compress`` makes smallest, writing it to
+``name + ".compressed.bin"``.  They differ only in the header's fields,
+in whether the last chunk is zero-padded first, in a byte transform on
+top of the reversal and in how candidates are drawn, so ``PaqEngine``
+takes those as parameters and ``PAQ_ENGINES`` holds one per script:
+
+``>QIII``  57, 68-70: size, chunk size 1, reversal and set counts, no
+           positions; reversing 1-byte chunks changes nothing
+``>QII``   58-67: size, chunk size, position count, positions; 61 and 62
+           write ``b"\\x00c\\x00\\x00"`` in front of the paq stream
+``>III``   71-73, as 58-67 with 4-byte sizes
+``>IIB``   73.1, 74, 74.1, 83-84, 86-88, with a 1-byte position count;
+           83 and 84 complement every byte as well
+``>IIB``   75-78, 80-82, 85, plus a strategy byte after the positions
+``>IIIB``  89: size, chunk size, a value whose low byte every byte is
+           XORed with, position count, positions
+
+Strategies other than plain reversal (75-85 insert random bytes, 73.1
+and 74.1 score altered data) cannot be extracted, so the engines only
+produce the plain one and write the strategy byte the scripts write with
+it.  ``extract`` reads what the scripts' extractors read; for 64 that
+skips the ``b"\\x00c\\x00"`` prefix check its extractor makes, which no
+file it wrote passes.  ``paq`` is imported on first use, so the other
+engines work without it.
+"""
+
+import random
+import struct
+from functools import partial
+
+from .chunk_search import evaluate_candidates, random_candidate
+from .reversal import reversed_chunks
+
+# The search budget of 58-75; the scripts that count iterations instead
+# get the same.
+SEARCH_SECONDS = 60
+
+_COMPLEMENT = bytes(255 - byte for byte in range(256))
+
+
+def _paq():
+    try:
+        import paq
+    except ImportError:
+        raise ImportError("the paq engines need the paq package") from None
+    return paq
+
+
+def _xor(data, key):
+    if not key:
+        return bytes(data)
+    if key == 0xFF:
+        return bytes(data).translate(_COMPLEMENT)
+    return bytes(data).translate(bytes(byte ^ key for byte in range(256)))
+
+
+def draw_sets(file_size):
+    """57, 68-70: chunk size 1 and only the counts in the header vary."""
+    counts = random.randint(1, 64), random.randint(1, min(file_size, 64))
+    return 1, [], counts
+
+
+def draw_stepped(file_size, positions_share=None):
+    """58-62: a multiple of 64 up to 512, and *positions_share* of the chunks.
+
+    Without *positions_share*, up to 64 chunks, unsorted.  A file under
+    64 bytes, for which the scripts draw nothing, gets one 64-byte chunk.
+    """
+    chunk_size = random.choice(range(64, max(min(513, file_size + 1), 65), 64))
+    chunks = -(-file_size // chunk_size)
+    if positions_share is None:
+        count = min(chunks, 64)
+    else:
+        count = int(chunks * positions_share)
+    return chunk_size, random.sample(range(chunks), count), ()
+
+
+def draw_bytes(file_size):
+    """63, 65-67: up to 64 single bytes, in order."""
+    positions = sorted(random.sample(range(file_size), min(file_size, 64)))
+    return 1, positions, ()
+
+
+def draw_spread(file_size):
+    """64: up to 64 positions ``2**31 / file_size`` apart."""
+    count = random.randint(1, min(file_size, 64))
+    return 1, [i * (2 ** 31) // file_size for i in range(count)], ()
+
+
+def draw_random(file_size, max_chunk_size=None):
+    """71-85: ``random_candidate`` with chunks of up to *max_chunk_size*.
+
+    By default that is 256, or the file size if it is less; 71 and 72 do
+    not cap it.
+    """
+    if max_chunk_size is None:
+        max_chunk_size = min(256, file_size)
+    chunk_size, positions = random_candidate(file_size, max_chunk_size)
+    return chunk_size, positions, ()
+
+
+def draw_half(file_size):
+    """86-88: chunks of 128 bytes, or half the file if that is less."""
+    chunk_size = max(1, min(128, file_size // 2))
+    chunks = file_size // chunk_size
+    count = random.randint(0, min(chunks, 64))
+    return chunk_size, sorted(random.sample(range(chunks), count)), ()
+
+
+def draw_calculus(file_size):
+    """89: chunks of 2**7 to 2**17 - 1 bytes and an XOR value below 2**17."""
+    chunk_size = random.randint(2 ** 7, 2 ** 17 - 1)
+    calculus_value = random.randint(1, 2 ** random.randint(7, 17) - 1)
+    chunks = file_size // chunk_size
+    count = random.randint(0, min(chunks, 64))
+    return chunk_size, sorted(random.sample(range(chunks), count)), (calculus_value,)
+
+
+class PaqEngine:
+    """One paq chunk-reversal engine; see the module doc for the variants.
+
+    *fields* is the header's struct format: the original size, the chunk
+    size, any extra fields a candidate carries, then (with *positioned*)
+    the position count, which the positions follow as ``>I`` each.
+    *draw* takes the file size and returns ``(chunk_size, positions,
+    extra)``.  With *pad* the last chunk is zero-padded before reversing;
+    *strategy*, if not None, is the byte written after the positions;
+    *complement* and *calculus* XOR every byte with 0xFF or with the low
+    byte of the first extra field; *magic* goes in front of the paq stream.
+    """
+
+    def __init__(
+        self,
+        name,
+        fields,
+        draw,
+        pad=False,
+        positioned=True,
+        strategy=None,
+        complement=False,
+        calculus=False,
+        magic=b"",
+    ):
+        self.name = name
+        self.fields = fields
+        self.draw = draw
+        self.pad = pad
+        self.positioned = positioned
+        self.strategy = strategy
+        self.complement = complement
+        self.calculus = calculus
+        self.magic = magic
+
+    def __repr__(self):
+        return "<PaqEngine %s>" % self.name
+
+    def _key(self, extra):
+        if self.complement:
+            return 0xFF
+        if self.calculus:
+            return extra[0] & 0xFF
+        return 0
+
+    def pack(self, data, candidate):
+        """Return the file the script writes for *candidate*."""
+        chunk_size, positions, extra = candidate
+        values = [len(data), chunk_size, *extra]
+        if self.positioned:
+            values.append(len(positions))
+        header = struct.pack(self.fields, *values)
+        if self.positioned:
+            header += struct.pack(">%dI" % len(positions), *positions)
+        if self.strategy is not None:
+            header += struct.pack(">B", self.strategy)
+        payload = reversed_chunks(data, chunk_size, positions, self.pad)
+        payload = _xor(payload, self._key(extra))
+        return self.magic + _paq().compress(header + payload)
+
+    def compress(self, data, max_time_seconds=SEARCH_SECONDS, jobs=1):
+        """Search candidates for *max_time_seconds*; return the smallest file.
+
+        The first candidate is always priced, however short the budget.
+        With *jobs* above 1 the candidates are priced on that many
+        processes (see ``evaluate_candidates``).
+        """
+        if not data:
+            raise ValueError("nothing to compress")
+        draw = partial(self.draw, len(data))
+        best = draw()
+        best_size = len(self.pack(data, best))
+        results = evaluate_candidates(
+            data,
+            lambda: (self.name, draw()),
+            _candidate_size,
+            max_time_seconds,
+            jobs,
+        )
+        for (_, candidate), size in results:
+            if size < best_size:
+                best, best_size = candidate, size
+        return self.pack(data, best)
+
+    def extract(self, data):
+        """Restore the data from a file the script wrote."""
+        if self.magic:
+            if data[: len(self.magic)] != self.magic:
+                raise ValueError(
+                    "not a Black_Hole_%s file: it does not start with %r"
+                    % (self.name, self.magic)
+                )
+            data = data[len(self.magic) :]
+        payload = _paq().decompress(data)
+        values = struct.unpack_from(self.fields, payload)
+        offset = struct.calcsize(self.fields)
+        size, chunk_size = values[:2]
+        positions = ()
+        if self.positioned:
+            extra, count = values[2:-1], values[-1]
+            positions = struct.unpack_from(">%dI" % count, payload, offset)
+            offset += 4 * count
+        else:
+            extra = values[2:]
+        if self.strategy is not None:
+            offset += 1
+        payload = _xor(payload[offset:], self._key(extra))
+        return reversed_chunks(payload, chunk_size, positions, self.pad)[:size]
+
+
+def _candidate_size(data, candidate):
+    name, candidate = candidate
+    return len(PAQ_ENGINES[name].pack(data, candidate))
+
+
+PAQ_ENGINES = {}
+
+
+def _add(names, fields, draw, **options):
+    for name in names.split():
+        PAQ_ENGINES[name] = PaqEngine(name, fields, draw, **options)
+
+
+_add("57 68 69 70", ">QIII", draw_sets, pad=True, positioned=False)
+_add("58", ">QII", partial(draw_stepped, positions_share=0.1))
+_add("59 60", ">QII", draw_stepped, pad=True)
+_add("61 62", ">QII", draw_stepped, pad=True, magic=b"\x00\x63\x00\x00")
+_add("63 65 66 67", ">QII", draw_bytes, pad=True)
+_add("64", ">QII", draw_spread, pad=True)
+_add("71 72", ">III", partial(draw_random, max_chunk_size=256), pad=True)
+_add("73", ">III", draw_random, pad=True)
+_add("73.1 74 74.1", ">IIB", draw_random, pad=True)
+_add("75", ">IIB", draw_random, pad=True, strategy=0)
+_add("76 77 82 85", ">IIB", draw_random, strategy=0)
+_add("78 80 81", ">IIB", draw_random, strategy=1)
+_add("83 84", ">IIB", draw_random, complement=True)
+_add("86 87 88", ">IIB", draw_half)
+_add("89", ">IIIB", draw_calculus, calculus=True)
@@ -0,0 +1,136 @@
+"""Parallel En-candidate search for the bit-string engines.
+
+Every En candidate is priced independently, so ``CandidateSearch`` shards
+the candidate list over a process pool and stores the results in the
+scanner's length cache.  The engine's ``while Find != 1`` loop then runs
+unchanged and reads each length from the cache, so the chosen En and the
+output bytes are the same as a serial run.
+
+The stream reaches the workers through ``multiprocessing.shared_memory``
+(Python 3.8+); on 3.7 it is sent along with each shard instead.
+"""
+
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.7
+    shared_memory = None
+
+from .bits import BitBuffer
+from .tokens import TokenScanner
+
+
+# Shards handed out per worker, so a slow shard does not hold up the rest.
+SHARDS_PER_JOB = 4
+
+# The stream this worker process last scanned, as (key, TokenScanner).
+_worker_scanner = None
+
+
+def process_pool(jobs, initializer=None, initargs=()):
+    """Return a ``ProcessPoolExecutor`` of *jobs* workers.
+
+    fork, where available, keeps workers from re-running the engine script
+    the way spawn would.  *initializer* is called with *initargs* in each
+    worker as it starts.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    return ProcessPoolExecutor(
+        jobs, mp_context=context, initializer=initializer, initargs=initargs
+    )
+
+
+def _worker_stream(key, nbytes, tail, tail_bits, payload):
+    global _worker_scanner
+    if _worker_scanner is None or _worker_scanner[0] != key:
+        if payload is None:
+            shm = shared_memory.SharedMemory(name=key)
+            try:
+                payload = bytes(shm.buf[:nbytes])
+            finally:
+                shm.close()
+        bits = BitBuffer(payload)
+        bits.write(tail, tail_bits)
+        _worker_scanner = key, TokenScanner(bits)
+    return _worker_scanner[1]
+
+
+def _scan_shard(key, nbytes, tail, tail_bits, payload, Ens, rule):
+    scanner = _worker_stream(key, nbytes, tail, tail_bits, payload)
+    return [(En, scanner.encoded_length(En, rule)) for En in Ens]
+
+
+class CandidateSearch:
+    """Fill ``TokenScanner`` length caches from a pool of *jobs* processes.
+
+    With ``jobs <= 1`` it does nothing and the engine scans serially.  The
+    pool is started on first use and reused for every Circle pass; use the
+    search as a context manager, or call ``close``, to shut it down.
+    """
+
+    def __init__(self, jobs=1):
+        self.jobs = jobs
+        self._pool = None
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = process_pool(self.jobs)
+        return self._pool
+
+    def prefetch(self, scanner, Ens, rule):
+        """Price every En in *Ens* in parallel and cache it on *scanner*.
+
+        Candidates wider than the stream are a single short token and
+        cheaper to price in place, so they are left to the serial loop.
+        """
+        if self.jobs <= 1:
+            return
+        Ens = [En for En in Ens if En <= scanner.size]
+        if not Ens:
+            return
+        bits = scanner.bits
+        nbytes = len(bits.data)
+        shm = None
+        if shared_memory is not None:
+            shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            shm.buf[:nbytes] = bits.data
+            key, payload = shm.name, None
+        else:
+            key, payload = uuid.uuid4().hex, bytes(bits.data)
+        try:
+            shards = self.jobs * SHARDS_PER_JOB
+            futures = [
+                self._executor().submit(
+                    _scan_shard,
+                    key,
+                    nbytes,
+                    bits._tail,
+                    bits._tail_bits,
+                    payload,
+                    Ens[k::shards],
+                    rule,
+                )
+                for k in range(min(shards, len(Ens)))
+            ]
+            for future in futures:
+                for En, result in future.result():
+                    scanner.store(En, rule, result)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,78 @@
+"""Cheap checks before comparing a search result with the whole file.
+
+The formula engines test ``int(INFO,2) == Number_of_the_file`` several
+times per iteration, parsing the file's bit string each time.
+``TargetFilter`` parses it once and rules out most candidates on their
+bit length, their low 64 bits or their residue modulo a few small primes
+before the full comparison, counting how many each check rejected.
+"""
+
+from .formula import HoleNumber
+
+_MASK = (1 << 64) - 1
+
+# The low 64 bits already cover 2; one remainder by the product of these
+# gives the residue modulo each of them.
+SMALL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
+_PRODUCT = 1
+for _p in SMALL_PRIMES:
+    _PRODUCT *= _p
+del _p
+
+
+class TargetFilter:
+    """The number the search is looking for, with the values it checks.
+
+    ``matches(number)`` tells whether *number* equals *target*.
+    ``eliminated`` maps each check to the candidates it rejected,
+    ``compared`` counts those that reached the full comparison and
+    ``matched`` those found equal.
+    """
+
+    CHECKS = ("bit length", "low 64 bits", "small primes")
+
+    def __init__(self, target):
+        self.target = target
+        self.bits = target.bit_length()
+        self.low = target & _MASK
+        self.residue = target % _PRODUCT
+        self.eliminated = dict.fromkeys(self.CHECKS, 0)
+        self.compared = 0
+        self.matched = 0
+
+    def _reject(self, check):
+        self.eliminated[check] += 1
+        return False
+
+    def matches(self, number):
+        if isinstance(number, HoleNumber):
+            # Its bit length is only known within bounds, and its own
+            # __eq__ checks its residue before building the digits.
+            low, high = number.bit_range()
+            if not low <= self.bits <= high:
+                return self._reject("bit length")
+            if number.low != self.low:
+                return self._reject("low 64 bits")
+        else:
+            if number.bit_length() != self.bits:
+                return self._reject("bit length")
+            if number & _MASK != self.low:
+                return self._reject("low 64 bits")
+            if number % _PRODUCT != self.residue:
+                return self._reject("small primes")
+        self.compared += 1
+        if number == self.target:
+            self.matched += 1
+            return True
+        return False
+
+    def report(self):
+        rejected = ", ".join(
+            "%d by %s" % (self.eliminated[check], check) for check in self.CHECKS
+        )
+        return "target filter: %s; %d compared, %d equal" % (
+            rejected,
+            self.compared,
+            self.matched,
+        )
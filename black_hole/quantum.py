@@ -0,0 +1,35 @@
+"""Optional qiskit diagnostic for the formula search (Black_Hole_26/56).
+
+The search loops used to build ``QuantumCircuit(Universe)`` and
+``QuantumCircuit(k2)`` for every ``k2`` and then drop both; nothing read
+them, and the second one grows with the counter until it costs far more
+than the formula step it sits next to.  The loops no longer touch qiskit.
+``circuit_diagnostic`` builds the ``Universe``-qubit circuit once, for the
+``k2`` the search stopped at, when the script is run with ``--quantum``;
+qiskit is only imported then, so it is not needed otherwise.
+"""
+
+
+def universe_qubits(k2):
+    """The loops' ``Universe``: ``k2.bit_length() + 1``, or 12 below 4."""
+    if k2 > 3:
+        return k2.bit_length() + 1
+    return 12
+
+
+def circuit_diagnostic(k2, enabled=True):
+    """Build and report the ``Universe`` circuit for *k2*.
+
+    Returns the circuit, or None when *enabled* is false or qiskit is not
+    installed.
+    """
+    if not enabled:
+        return None
+    try:
+        from qiskit import QuantumCircuit
+    except ImportError:
+        print("qiskit is not installed; skipping the circuit diagnostic.")
+        return None
+    circuit = QuantumCircuit(universe_qubits(k2))
+    print("Universe circuit for k2=%d: %d qubits" % (k2, circuit.num_qubits))
+    return circuit
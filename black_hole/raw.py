@@ -0,0 +1,47 @@
+"""Stored ``.b`` files.
+
+When a Circle pass does not pay, or the self-check fails, the engines
+write ``"00000000"`` followed by the input as it was (see
+``black_hole.bits.stored``).  Extracting such a file used to turn all of
+it into a ``"0"``/``"1"`` string and back only to drop the first byte;
+``copy_stored`` copies the rest of the file instead, in the kernel where
+``os.sendfile`` is available.
+"""
+
+import os
+import shutil
+
+
+def is_stored(path):
+    """Tell whether *path* holds a stored copy: its first byte is zero.
+
+    Streamed files start with a zero byte too, so check ``is_stream``
+    first.
+    """
+    with open(path, "rb") as src:
+        return src.read(1) == b"\x00"
+
+
+def copy_stored(src, dst):
+    """Write the data of stored file object *src* to *dst*.
+
+    Returns the number of bytes written.  Both must be real binary files;
+    *dst* is flushed first because ``os.sendfile`` writes past its buffer.
+    """
+    start = 1
+    end = os.fstat(src.fileno()).st_size
+    dst.flush()
+    try:
+        while start < end:
+            sent = os.sendfile(dst.fileno(), src.fileno(), start, end - start)
+            if not sent:
+                break
+            start += sent
+    except (AttributeError, OSError):
+        # No sendfile here (Windows, some file systems); copy what is left.
+        src.seek(start)
+        shutil.copyfileobj(src, dst)
+        return end - 1
+    if start < end:
+        raise ValueError("stored .b file shrank while it was copied")
+    return end - 1
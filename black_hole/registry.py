@@ -0,0 +1,105 @@
+"""The engines that work on bytes, by name.
+
+Each ``Black_Hole_N`` script asks for a file name with ``input()`` and
+writes its result next to that file.  The engines registered here take and
+return ``bytes`` instead, so a pipeline can call them in-process::
+
+    from black_hole import get_engine
+
+    engine = get_engine("34")
+    packed = engine.compress(data, passes=8)
+    assert engine.extract(packed) == data
+
+``compress(data, **params)`` returns what the script would write to
+``name + engine.suffix``; ``extract(data)`` reads anything that script
+can.  The bit-string engines 1, 4, 34, 39 and 46 write ``.b`` files,
+stored and streamed ones included; the paq engines 57-89
+(black_hole.paq_engines) write ``.compressed.bin`` files and need the
+``paq`` package.  ``register`` adds others under a new name.
+
+The formula engines 26/27/28/56 are not registered: they search until a
+formula reproduces the whole file, with no bound on the time it takes.
+"""
+
+import io
+from collections import namedtuple
+
+from .engine import (
+    Black_Hole_4,
+    Black_Hole_34,
+    Black_Hole_39,
+    Black_Hole_46,
+    black_hole_1,
+)
+from .paq_engines import PAQ_ENGINES
+from .stream import extract_stream, is_stream_file
+
+Engine = namedtuple("Engine", "name compress extract suffix")
+
+ENGINES = {}
+
+
+def register(name, compress, extract, suffix=".b"):
+    """Register *compress* and *extract* under *name*; return the Engine.
+
+    *suffix* is what the engine's script adds to the name of the file it
+    compresses.
+    """
+    name = str(name)
+    if name in ENGINES:
+        raise ValueError("engine %s is already registered" % name)
+    ENGINES[name] = Engine(name, compress, extract, suffix)
+    return ENGINES[name]
+
+
+def get_engine(name):
+    """Return the Engine registered as *name*, e.g. ``"34"`` or ``34``."""
+    try:
+        return ENGINES[str(name)]
+    except KeyError:
+        raise ValueError(
+            "no engine %s; registered: %s" % (name, ", ".join(engine_names()))
+        ) from None
+
+
+def _number_order(name):
+    try:
+        return 0, float(name), name
+    except ValueError:
+        return 1, 0.0, name
+
+
+def engine_names():
+    """The registered names, in number order (``"73"``, ``"73.1"``, ``"74"``)."""
+    return sorted(ENGINES, key=_number_order)
+
+
+def bit_engine_extract(engine):
+    """Return an ``extract(data)`` for ``BitEngine`` *engine*.
+
+    Streamed files are told apart from stored ones as the scripts do,
+    by their header and block index, before the stored-copy check.
+    """
+
+    def extract(data):
+        src = io.BytesIO(data)
+        if is_stream_file(src):
+            src.seek(0)
+            dst = io.BytesIO()
+            extract_stream(engine, src, dst)
+            return dst.getvalue()
+        return engine.extract(data)
+
+    return extract
+
+
+def _compress_1(data, En_number=15, **params):
+    return black_hole_1(En_number).compress(data, **params)
+
+
+register("1", _compress_1, bit_engine_extract(black_hole_1()))
+for _engine in (Black_Hole_4, Black_Hole_34, Black_Hole_39, Black_Hole_46):
+    register(_engine.name, _engine.compress, bit_engine_extract(_engine))
+for _engine in PAQ_ENGINES.values():
+    register(_engine.name, _engine.compress, _engine.extract, ".compressed.bin")
+del _engine
@@ -0,0 +1,89 @@
+"""Chunk reversal for the paq engines (Black_Hole_57-89).
+
+Their ``reverse_chunks_at_positions`` / ``reverse_chunks_in_memory`` /
+``reverse_chunks`` cut the whole input into a list of ``chunk_size``-byte
+``bytes``, reverse a few of them and join the list again, for every
+candidate.  ``ChunkReverser`` keeps one ``bytearray`` copy of the input
+instead and reverses the chosen chunks in it with slice assignment; the
+next candidate first puts those chunks back, so a candidate costs work
+and memory in proportion to the chunks it reverses, not the file.
+
+With *pad*, the data is zero-padded to whole chunks before reversing, as
+the engines that pad their last chunk do.  Positions past the last chunk
+are ignored.
+"""
+
+
+class ChunkReverser:
+    """A working copy of *data* in which chunks are reversed in place."""
+
+    def __init__(self, data, pad=False):
+        self.data = data
+        self.size = len(data)
+        self.pad = pad
+        self.buffer = bytearray(data)
+        self.end = self.size
+        self._reversed = []
+
+    def _extend(self, end):
+        if end > len(self.buffer):
+            # A new buffer, as views of the old one may still be held.
+            buffer = bytearray(end)
+            buffer[: len(self.buffer)] = self.buffer
+            self.buffer = buffer
+        self.end = end
+
+    def reverse(self, chunk_size, positions):
+        """Reverse chunks on top of any already reversed; return a view.
+
+        A chunk listed twice is reversed twice, as in the engines' loops.
+        """
+        chunks = -(-self.size // chunk_size)
+        if self.pad:
+            self._extend(max(self.end, chunks * chunk_size))
+        buffer = self.buffer
+        for pos in positions:
+            if 0 <= pos < chunks:
+                start = pos * chunk_size
+                stop = min(start + chunk_size, self.end)
+                buffer[start:stop] = buffer[start:stop][::-1]
+                self._reversed.append((start, stop))
+        return memoryview(buffer)[: self.end]
+
+    def revert(self):
+        """Put every reversed chunk back; the buffer holds *data* again."""
+        buffer = self.buffer
+        for start, stop in reversed(self._reversed):
+            buffer[start:stop] = buffer[start:stop][::-1]
+        del self._reversed[:]
+        self.end = self.size
+
+    def apply(self, chunk_size, positions):
+        """``revert`` then ``reverse``: the data with just these chunks reversed.
+
+        The view is only good until the next call that changes the buffer.
+        """
+        self.revert()
+        return self.reverse(chunk_size, positions)
+
+
+def reversed_chunks(data, chunk_size, positions, pad=False):
+    """Return *data* with the chunks at *positions* reversed, as ``bytes``."""
+    return bytes(ChunkReverser(data, pad).reverse(chunk_size, positions))
+
+
+# The reverser of the data this process is searching, kept across
+# candidates the way black_hole.segments keeps its scorer.
+_reverser = None
+
+
+def reversed_view(data, chunk_size, positions, pad=False):
+    """``ChunkReverser.apply`` on a reverser kept for *data* in this process.
+
+    The view changes on the next call; use it, for example in
+    ``metadata + view``, before drawing the next candidate.
+    """
+    global _reverser
+    if _reverser is None or _reverser.data is not data or _reverser.pad != pad:
+        _reverser = ChunkReverser(data, pad)
+    return _reverser.apply(chunk_size, positions)
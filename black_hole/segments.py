@@ -0,0 +1,130 @@
+"""Segmented pricing of chunk-reversal candidates (Black_Hole_71-75).
+
+A candidate reverses at most 64 chunks of up to 256 bytes, yet scoring it
+meant reversing into a copy of the whole file and compressing all of it.
+``SegmentedScorer`` prices the reversed file as fixed-size segments
+compressed one by one: segments no reversed chunk reaches keep the size
+of the original segment, compressed once, and only the segments an edit
+touches are compressed again, with those results cached too.  The cost
+of a candidate then follows its edit rather than the file.
+
+The sum over segments is an estimate of what one paq call over the whole
+file gives; it is meant for ranking candidates, and the engines still
+compress the winner whole.
+"""
+
+from collections import OrderedDict
+
+SEGMENT_SIZE = 1 << 16
+
+# Touched-segment variants kept before the least recently used is dropped.
+VARIANT_LIMIT = 1 << 12
+
+
+class SegmentedScorer:
+    """Compressed sizes of *data* with chunks reversed, by segment.
+
+    *compress* is the compressor to price segments with, such as
+    ``paq.compress``.
+    """
+
+    def __init__(self, data, compress, segment_size=SEGMENT_SIZE, limit=VARIANT_LIMIT):
+        self.data = data
+        self.compress = compress
+        self.segment_size = segment_size
+        self.limit = limit
+        self.compressed = 0
+        self.reused = 0
+        self._base = {}
+        self._variants = OrderedDict()
+
+    def _price(self, segment):
+        self.compressed += 1
+        return len(self.compress(bytes(segment)))
+
+    def _base_size(self, k):
+        size = self._base.get(k)
+        if size is None:
+            start = k * self.segment_size
+            size = self._price(self.data[start : start + self.segment_size])
+            self._base[k] = size
+        else:
+            self.reused += 1
+        return size
+
+    def _segment(self, k, chunk_size, positions, end):
+        """Segment *k* of the reversed data, which is *end* bytes long."""
+        data = self.data
+        start = k * self.segment_size
+        stop = min(start + self.segment_size, end)
+        segment = bytearray(data[start:stop])
+        segment.extend(bytes(stop - start - len(segment)))
+        for pos in positions:
+            first = pos * chunk_size
+            chunk = data[first : first + chunk_size]
+            chunk = (chunk + bytes(chunk_size - len(chunk)))[::-1]
+            low = max(first, start)
+            high = min(first + chunk_size, stop)
+            segment[low - start : high - start] = chunk[low - first : high - first]
+        return segment
+
+    def size(self, chunk_size, positions):
+        """Summed segment sizes of the data ``reverse_chunks_at_positions`` makes.
+
+        As there, the data is padded with zeros to whole chunks and
+        positions past the last chunk are ignored.
+        """
+        n = len(self.data)
+        chunks = -(-n // chunk_size)
+        end = chunks * chunk_size
+        segment_size = self.segment_size
+        touched = {}
+        for pos in positions:
+            if 0 <= pos < chunks:
+                first = pos * chunk_size
+                last = first + chunk_size - 1
+                for k in range(first // segment_size, last // segment_size + 1):
+                    touched.setdefault(k, []).append(pos)
+        if end > n:
+            # The zero padding changes the segments it lands in.
+            for k in range(n // segment_size, (end - 1) // segment_size + 1):
+                touched.setdefault(k, [])
+        total = 0
+        for k in range(-(-end // segment_size)):
+            if k not in touched:
+                total += self._base_size(k)
+                continue
+            key = k, chunk_size, tuple(touched[k]), end
+            size = self._variants.get(key)
+            if size is None:
+                segment = self._segment(k, chunk_size, touched[k], end)
+                size = self._price(segment)
+                self._variants[key] = size
+                if len(self._variants) > self.limit:
+                    self._variants.popitem(last=False)
+            else:
+                self._variants.move_to_end(key)
+                self.reused += 1
+            total += size
+        return total
+
+    def report(self):
+        return "segments: %d compressed, %d reused" % (self.compressed, self.reused)
+
+
+# The scorer of the data this process is searching, so that its caches
+# last across candidates in a worker as well as in a serial search.
+_scorer = None
+
+
+def segmented_size(data, chunk_size, positions, compress, segment_size=SEGMENT_SIZE):
+    """``SegmentedScorer.size`` on a scorer kept for *data* in this process."""
+    global _scorer
+    if (
+        _scorer is None
+        or _scorer.data is not data
+        or _scorer.compress is not compress
+        or _scorer.segment_size != segment_size
+    ):
+        _scorer = SegmentedScorer(data, compress, segment_size)
+    return _scorer.size(chunk_size, positions)
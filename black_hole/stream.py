@@ -0,0 +1,260 @@
+"""Block-by-block ``.b`` files for inputs of any size.
+
+The engines turn a whole file into one integer and one bit stream, which
+is why they stop at ``2**28 - 1`` bytes.  A streamed ``.b`` file instead
+holds the input as independent blocks::
+
+    b"\\x00BHS" | version | name length | engine name | block size (4 bytes)
+    payload | payload | ...
+    index, per block: offset (8 bytes) | raw size (4) | payload size (4)
+    footer: index offset (8 bytes) | block count (4) | b"BHSI"
+
+Each payload is what ``BitEngine.compress`` makes of that block alone, so
+every block gets its own En search and Circle passes, and memory use
+follows the block size rather than the file size.  The leading zero byte
+is the stored-raw marker: an engine that predates this format reads a
+streamed file back as stored data instead of misdecoding it.
+
+Since the blocks are independent, *jobs* spreads them over a process pool.
+The index lets each worker seek straight to its block when extracting, so
+blocks are decoded concurrently and written out in the order they finish.
+Version 1 files, where each payload follows its raw and payload sizes and
+there is no index, are still read.
+"""
+
+import os
+import struct
+from collections import deque
+from concurrent.futures import as_completed
+
+from .parallel import process_pool
+
+MAGIC = b"\x00BHS"
+INDEX_MAGIC = b"BHSI"
+VERSION = 2
+DEFAULT_BLOCK_SIZE = 1 << 20
+MAX_BLOCK_SIZE = (2 ** 28) - 1
+
+# Blocks queued per worker while compressing; bounds memory to a few blocks.
+BLOCKS_PER_JOB = 2
+
+_SIZE = struct.Struct(">I")
+_FRAME = struct.Struct(">II")
+_ENTRY = struct.Struct(">QII")
+_FOOTER = struct.Struct(">QI4s")
+
+
+def _read_blocks(src, block_size):
+    while True:
+        block = src.read(block_size)
+        if not block:
+            return
+        yield block
+
+
+def _compress_blocks(engine, blocks, jobs, options):
+    """Yield ``(raw size, payload)`` per block, in input order."""
+    if jobs <= 1:
+        for block in blocks:
+            yield len(block), engine.compress(block, **options)
+        return
+    pool = process_pool(jobs)
+    pending = deque()
+    try:
+        for block in blocks:
+            future = pool.submit(engine.compress, block, **options)
+            pending.append((len(block), future))
+            if len(pending) >= jobs * BLOCKS_PER_JOB:
+                raw_size, future = pending.popleft()
+                yield raw_size, future.result()
+        while pending:
+            raw_size, future = pending.popleft()
+            yield raw_size, future.result()
+    finally:
+        for raw_size, future in pending:
+            future.cancel()
+        pool.shutdown()
+
+
+def compress_stream(
+    engine, src, dst, block_size=DEFAULT_BLOCK_SIZE, jobs=1, **options
+):
+    """Compress file object *src* into *dst*; return the number of blocks.
+
+    With *jobs* above 1 the blocks are compressed on that many processes;
+    the output is byte for byte that of a serial run.  *options*, such as
+    ``passes`` or ``seed_window``, go to ``engine.compress`` for each block.
+    """
+    if not 0 < block_size <= MAX_BLOCK_SIZE:
+        raise ValueError("block size must be 1 to %d bytes" % MAX_BLOCK_SIZE)
+    name = engine.name.encode("ascii")
+    header = MAGIC + bytes((VERSION, len(name))) + name + _SIZE.pack(block_size)
+    dst.write(header)
+    offset = len(header)
+    index = []
+    blocks = _read_blocks(src, block_size)
+    for raw_size, payload in _compress_blocks(engine, blocks, jobs, options):
+        dst.write(payload)
+        index.append(_ENTRY.pack(offset, raw_size, len(payload)))
+        offset += len(payload)
+    dst.write(b"".join(index))
+    dst.write(_FOOTER.pack(offset, len(index), INDEX_MAGIC))
+    return len(index)
+
+
+def _read_exact(src, size):
+    data = src.read(size)
+    if len(data) != size:
+        raise ValueError("streamed .b file is truncated")
+    return data
+
+
+def read_header(src):
+    """Read a streamed file's header; return ``(name, block size, version)``."""
+    if src.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a streamed .b file")
+    version, length = _read_exact(src, 2)
+    if version not in (1, VERSION):
+        raise ValueError("unknown streamed .b version %d" % version)
+    name = _read_exact(src, length).decode("ascii")
+    (block_size,) = _SIZE.unpack(_read_exact(src, _SIZE.size))
+    return name, block_size, version
+
+
+def iter_frames(src):
+    """Yield ``(raw size, payload)`` for each block of a version 1 file."""
+    while True:
+        head = src.read(_FRAME.size)
+        if not head:
+            return
+        if len(head) != _FRAME.size:
+            raise ValueError("streamed .b file is truncated")
+        raw_size, payload_size = _FRAME.unpack(head)
+        yield raw_size, _read_exact(src, payload_size)
+
+
+def read_index(src, start):
+    """Return a version 2 file's ``(offset, raw size, payload size)`` rows.
+
+    *start* is where the payloads begin, just after the header.  The rows
+    must cover the payload area in order and end where the index begins.
+    """
+    size = src.seek(0, os.SEEK_END)
+    if size < start + _FOOTER.size:
+        raise ValueError("streamed .b file is truncated")
+    src.seek(size - _FOOTER.size)
+    index_offset, count, magic = _FOOTER.unpack(src.read(_FOOTER.size))
+    if magic != INDEX_MAGIC or index_offset + count * _ENTRY.size != (
+        size - _FOOTER.size
+    ):
+        raise ValueError("streamed .b file has no valid block index")
+    src.seek(index_offset)
+    table = _read_exact(src, count * _ENTRY.size)
+    rows = [_ENTRY.unpack_from(table, k * _ENTRY.size) for k in range(count)]
+    for offset, raw_size, payload_size in rows:
+        if offset != start:
+            raise ValueError("streamed .b file has no valid block index")
+        start += payload_size
+    if start != index_offset:
+        raise ValueError("streamed .b file has no valid block index")
+    return rows
+
+
+def is_stream(path):
+    """Tell whether *path* is a streamed ``.b`` file.
+
+    Besides the header, the blocks must tile the file exactly: the index of
+    a version 2 file is checked against the footer, the frames of a
+    version 1 file are walked with ``seek``.  Payloads are never read.
+    """
+    with open(path, "rb") as src:
+        return is_stream_file(src)
+
+
+def is_stream_file(src):
+    """``is_stream`` for seekable file object *src*, read from the start."""
+    size = src.seek(0, os.SEEK_END)
+    src.seek(0)
+    try:
+        version = read_header(src)[2]
+        if version != 1:
+            read_index(src, src.tell())
+            return True
+    except ValueError:
+        return False
+    while src.tell() < size:
+        head = src.read(_FRAME.size)
+        if len(head) != _FRAME.size:
+            return False
+        src.seek(_FRAME.unpack(head)[1], os.SEEK_CUR)
+    return src.tell() == size
+
+
+def _indexed_frames(src, rows):
+    for offset, raw_size, payload_size in rows:
+        src.seek(offset)
+        yield raw_size, _read_exact(src, payload_size)
+
+
+def _extract_block(engine, path, offset, raw_size, payload_size):
+    with open(path, "rb") as src:
+        src.seek(offset)
+        payload = _read_exact(src, payload_size)
+    block = engine.extract(payload, limit=32 * raw_size + 1024)
+    if len(block) != raw_size:
+        raise ValueError(
+            "block at offset %d decoded to %d bytes, expected %d"
+            % (offset, len(block), raw_size)
+        )
+    return block
+
+
+def extract_stream(engine, src, dst, jobs=1):
+    """Decode streamed file object *src* into *dst*; return the block count.
+
+    With *jobs* above 1 the blocks of a version 2 file are decoded on that
+    many processes, each reading its payload from ``src.name``; *dst* must
+    then be seekable, since blocks are written as they finish.
+    """
+    name, block_size, version = read_header(src)
+    if name != engine.name:
+        raise ValueError("this file was written by Black_Hole_%s" % name)
+    if version == 1:
+        rows = None
+        frames = iter_frames(src)
+    else:
+        rows = read_index(src, src.tell())
+        frames = _indexed_frames(src, rows)
+    if rows is None or jobs <= 1 or len(rows) <= 1:
+        blocks = 0
+        for raw_size, payload in frames:
+            block = engine.extract(payload, limit=32 * raw_size + 1024)
+            if len(block) != raw_size:
+                raise ValueError(
+                    "block %d decoded to %d bytes, expected %d"
+                    % (blocks, len(block), raw_size)
+                )
+            dst.write(block)
+            blocks += 1
+        return blocks
+    base = dst.tell()
+    starts = []
+    for offset, raw_size, payload_size in rows:
+        starts.append(base)
+        base += raw_size
+    pool = process_pool(jobs)
+    futures = {}
+    try:
+        futures = {
+            pool.submit(_extract_block, engine, src.name, *row): start
+            for row, start in zip(rows, starts)
+        }
+        for future in as_completed(futures):
+            dst.seek(futures[future])
+            dst.write(future.result())
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown()
+    dst.seek(base)
+    return len(rows)
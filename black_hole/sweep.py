@@ -0,0 +1,174 @@
+"""Parallel sweep of the ``k2`` counter in Black_Hole_26/56.
+
+The formula search takes ``Multiply_Times``, ``SQUARE_OF_ROOT``,
+``Add_Numbers``, ``Multiply`` and ``Times_12`` from successive bytes of
+``k2``, runs ``process_files`` and compares the result with the file.
+Below ``ONE_STEP_LIMIT`` the ``Times_12`` byte is 0 or 1, so every chain
+is a single step that starts from ``Multiply_Times``: each ``k2`` can be
+tried on its own.  The only state carried from one ``k2`` to the next is
+``counts``, which grows by one for every step that changed its number, and
+that is a sum the shards can each take over their own range.
+
+``sweep_k2`` hands out shards of ``k2`` to a process pool, stops handing
+out (and cancels) shards above a hit as soon as one is reported, and
+returns where the scripts' own loop has to pick up: at the hit, so that
+the loop writes the file exactly as a serial run would, or at the end of
+the range.  *progress* is told the lowest untried ``k2`` as the finished
+shards reach it, and ``sweep_search`` keeps that in a ``Checkpoint``.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from .checkpoint import Checkpoint
+from .formula import hole_step
+from .parallel import SHARDS_PER_JOB, process_pool
+
+ONE_STEP_LIMIT = 1 << 33
+SHARD_SIZE = 1 << 16
+
+# Black_Hole_56 counts Square_Root_26_1024_1024 down from here, once per
+# step; when it reaches 2 the step starts from 2**2 instead of the file.
+SQUARE_ROOT_START = 26 * 1024 * 1024
+
+
+def scan_k2(engine, target, start, stop, Key=1):
+    """Try every ``k2`` in ``[start, stop)`` in order.
+
+    *engine* is 26 or 56.  Returns ``(hit, changed)``: the
+    first ``k2`` whose step gives *target* (or None) and how many steps up
+    to and including it, or up to *stop*, changed their number.  ``k2 == 0``
+    only turns ``counts`` from -1 to 0 and is not counted.
+    """
+    changed = 0
+    late = SQUARE_ROOT_START - 3 if engine == 56 else -1
+    for k2 in range(start, stop):
+        Multiply_Times = k2 & 0xFF
+        Multiply = (k2 >> 24) & 0xFF or 1
+        if k2 == late:
+            Number = hole_step(1, (k2 >> 8) & 0xFF, (k2 >> 16) & 0xFF, Multiply, Key, 2)
+        else:
+            Number = hole_step(
+                Multiply_Times, (k2 >> 8) & 0xFF, (k2 >> 16) & 0xFF, Multiply, Key
+            )
+        if k2 and Number != Multiply_Times:
+            changed += 1
+        if Number == target:
+            return k2, changed
+    return None, changed
+
+
+def _shards(start, stop, size):
+    while start < stop:
+        yield start, min(start + size, stop)
+        start += size
+
+
+def sweep_k2(
+    engine,
+    target,
+    start=0,
+    counts=-1,
+    stop=ONE_STEP_LIMIT,
+    jobs=1,
+    progress=None,
+    shard_size=SHARD_SIZE,
+):
+    """Sweep ``k2`` from *start*, where the loop's ``counts`` is *counts*.
+
+    Returns ``(k2, counts)``: the next ``k2`` the serial loop has to try and
+    ``counts`` as it stands before that iteration.  *progress* is called
+    as ``progress(k2, counts)`` with the same meaning whenever a shard
+    finishes and the lowest untried ``k2`` moves.
+    """
+    if target.bit_length() > 8 + 255 + 8 + 3:
+        # No single step gets this wide, so only counts is wanted.
+        target = -1
+    pending = _shards(start, stop, shard_size)
+    if jobs <= 1:
+        for a, b in pending:
+            hit, changed = scan_k2(engine, target, a, b)
+            if hit is not None:
+                return hit, _before(counts, a, hit, changed, engine, target)
+            counts = _add(counts, a, changed)
+            if progress is not None:
+                progress(b, counts)
+        return stop, counts
+    pool = process_pool(jobs)
+    running = {}
+    done = {}
+    frontier = start
+    best = None
+    try:
+        while True:
+            while best is None and len(running) < jobs * SHARDS_PER_JOB:
+                shard = next(pending, None)
+                if shard is None:
+                    break
+                future = pool.submit(scan_k2, engine, target, *shard)
+                running[future] = shard
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                a, b = running.pop(future)
+                hit, changed = future.result()
+                done[a] = b, hit, changed
+                if hit is not None and (best is None or hit < best):
+                    best = hit
+                    for other, (c, d) in list(running.items()):
+                        if c > hit and other.cancel():
+                            del running[other]
+            while frontier in done:
+                b, hit, changed = done.pop(frontier)
+                if hit is not None:
+                    return hit, _before(counts, frontier, hit, changed, engine, target)
+                counts = _add(counts, frontier, changed)
+                frontier = b
+                if progress is not None:
+                    progress(frontier, counts)
+        return stop, counts
+    finally:
+        for future in running:
+            future.cancel()
+        pool.shutdown()
+
+
+def _add(counts, start, changed):
+    # k2 == 0 turns counts from -1 to 0 without counting a change.
+    if start == 0:
+        counts = 0
+    return counts + changed
+
+
+def _before(counts, start, hit, changed, engine, target):
+    """``counts`` entering iteration *hit*, from its shard's totals."""
+    if hit == 0:
+        return counts
+    last = scan_k2(engine, target, hit, hit + 1)[1]
+    return _add(counts, start, changed - last)
+
+
+def sweep_search(engine, name, data, target, jobs=1, resume=False):
+    """Run ``sweep_k2`` for input *data* of file *name*, with a checkpoint.
+
+    ``k2`` and ``counts`` go to the ``Checkpoint`` as the shards finish;
+    with *resume* the sweep starts from the one a stopped run left behind.
+    The checkpoint is removed once a hit is found.
+    """
+    checkpoint = Checkpoint(name, data, engine)
+    state = checkpoint.load() if resume else None
+    start, counts = state[0] if state else (0, -1)
+    k2, counts = sweep_k2(
+        engine,
+        target,
+        start,
+        counts,
+        max(start, ONE_STEP_LIMIT),
+        jobs,
+        lambda k2, counts: checkpoint.save((k2, counts)),
+    )
+    if k2 < ONE_STEP_LIMIT:
+        checkpoint.remove()
+    else:
+        checkpoint.save((k2, counts), force=True)
+    return k2, counts
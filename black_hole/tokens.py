@@ -0,0 +1,209 @@
+"""Length-only evaluation of the En-width token pass.
+
+The En search in ``cryptograpy_compression4`` only compares encoded
+lengths, so building ``TUPLE`` for every candidate is wasted work.
+``TokenScanner`` prepares a stream once; ``encoded_length(En, rule)`` then
+builds a histogram of the leading-zero counts of the En-bit words and
+prices it in closed form, since a full token's encoded width depends only
+on its zero count.  Without NumPy the counts come from a loop over ints.
+With NumPy they are counted ``HISTOGRAM_BLOCK`` tokens at a time, so the
+temporary arrays stay the same size however long the stream is.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; TokenScanner falls back to ints.
+    np = None
+
+
+if np is not None:
+    # Leading zeros of a byte; index 0 is never read (sentinel byte is 0xFF).
+    _CLZ8 = np.array([8 - i.bit_length() for i in range(256)], dtype=np.int64)
+
+# Tokens whose zero counts the NumPy path works out in one go.
+HISTOGRAM_BLOCK = 1 << 16
+
+
+def zeros_cost(En, zeros, rule):
+    """Encoded width of a full En-bit token with *zeros* leading zeros.
+
+    Returns ``(cost, rewritten)``.  A full token's encoding depends only on
+    its zero count: ``"011"`` + count field + ``En - zeros`` bits, ``"010"``
+    + ``En - 2`` bits when it starts ``"01"``, or the token itself.
+    """
+    if zeros == 1 and En >= 3:
+        return En + 1, True
+    if rule(En, zeros):
+        return 3 + En.bit_length() + En - zeros, True
+    return En, False
+
+
+def histogram_cost(En, histogram, rule):
+    """Closed-form encoded length of the full tokens in *histogram*.
+
+    *histogram* is ``(zeros, counts)``: the distinct leading-zero counts and
+    how many tokens have each.  Returns ``(length, rewritten)``.
+    """
+    zeros, counts = histogram
+    if np is None:
+        total = 0
+        hit = False
+        for z, n in zip(zeros, counts):
+            cost, rewritten = zeros_cost(En, z, rule)
+            total += cost * n
+            hit = hit or rewritten
+        return total, hit
+    prefix = (zeros == 1) & (En >= 3)
+    rewritten = rule(En, zeros) | prefix
+    cost = np.where(
+        rewritten,
+        np.where(prefix, En + 1, 3 + En.bit_length() + En - zeros),
+        En,
+    )
+    return int((cost * counts).sum()), bool(rewritten.any())
+
+
+def token_cost(En, value, longl, rule):
+    """Encoded width of one token and whether it was rewritten.
+
+    Mirrors ``encode_tokens``; *longl* may be shorter than En for the last
+    token, whose ``"010"`` test then looks at its own first two bits.
+    """
+    length = value.bit_length() or 1
+    if longl == En:
+        return zeros_cost(En, En - length, rule)
+    zeros = En - length
+    if rule(En, zeros) or (longl >= 3 and value >> (longl - 2) == 1):
+        if zeros != 1:
+            return 3 + En.bit_length() + length, True
+        return longl + 1, True
+    return longl, False
+
+
+class TokenScanner:
+    """A stream prepared for repeated ``encoded_length`` queries."""
+
+    def __init__(self, bits):
+        self.bits = bits
+        self.size = len(bits)
+        self._bytes = None
+        self._skip = None
+        self._far = None
+        self._lengths = {}
+        if np is not None:
+            self._prepare()
+
+    def _prepare(self):
+        # Pad the partial last byte with zeros and add a 0xFF sentinel so
+        # that every token start has a "first one" at or after it.
+        raw = bytearray(self.bits.data)
+        if self.bits._tail_bits:
+            raw.append(self.bits._tail << (8 - self.bits._tail_bits))
+        raw.append(0xFF)
+        arr = np.frombuffer(raw, dtype=np.uint8)
+        # How far each byte is from the next nonzero one, capped at 255 to
+        # keep to a byte per byte; where the cap is hit, the nonzero byte
+        # is looked up in _far, the bytes that end longer zero runs.  Built
+        # from the end a block at a time, carrying the next nonzero byte.
+        skip = np.empty(len(arr), dtype=np.uint8)
+        far = []
+        nxt = len(arr) - 1
+        for stop in range(len(arr), 0, -HISTOGRAM_BLOCK):
+            begin = max(stop - HISTOGRAM_BLOCK, 0)
+            index = np.arange(begin, stop, dtype=np.int64)
+            block = np.where(arr[begin:stop] != 0, index, nxt)
+            block = np.minimum.accumulate(block[::-1])[::-1]
+            nxt = int(block[0])
+            distance = block - index
+            capped = distance >= 255
+            if capped.any():
+                far.append(np.unique(block[capped]))
+            skip[begin:stop] = np.minimum(distance, 255)
+        self._bytes = arr
+        self._skip = skip
+        self._far = np.concatenate(far[::-1]) if far else np.zeros(0, np.int64)
+
+    def leading_zeros(self, En, first=0, last=None):
+        """Leading-zero counts of the full En-bit tokens, as ``En - len(C)``.
+
+        An all-zero token counts ``En - 1``, since ``format(0, "01b")`` is
+        one character long.  *first* and *last* limit it to those tokens.
+        """
+        full = self.size // En
+        last = full if last is None else min(last, full)
+        if np is None:
+            return [
+                En - (self.bits.get(k * En, En).bit_length() or 1)
+                for k in range(first, last)
+            ]
+        starts = np.arange(first, last, dtype=np.int64) * En
+        byte = starts >> 3
+        head = self._bytes[byte] & (0xFF >> (starts & 7))
+        nxt = byte + 1 + self._skip[byte + 1]
+        capped = self._skip[byte + 1] == 255
+        if capped.any():
+            nxt[capped] = self._far[np.searchsorted(self._far, byte[capped] + 1)]
+        first_one = np.where(
+            head != 0,
+            (byte << 3) + _CLZ8[head],
+            (nxt << 3) + _CLZ8[self._bytes[nxt]],
+        )
+        return np.minimum(first_one - starts, En - 1)
+
+    def histogram(self, En):
+        """Return ``(zeros, counts)`` over the full En-bit tokens.
+
+        Only zero counts that occur are listed, so the result stays small
+        however large En gets.
+        """
+        if np is None:
+            counts = {}
+            for z in self.leading_zeros(En):
+                counts[z] = counts.get(z, 0) + 1
+            return list(counts), list(counts.values())
+        counts = np.zeros(0, dtype=np.int64)
+        for first in range(0, self.size // En, HISTOGRAM_BLOCK):
+            block = np.bincount(
+                self.leading_zeros(En, first, first + HISTOGRAM_BLOCK)
+            )
+            if len(block) > len(counts):
+                block[: len(counts)] += counts
+                counts = block
+            else:
+                counts[: len(block)] += block
+        present = np.flatnonzero(counts)
+        return present, counts[present]
+
+    def encoded_length(self, En, rule):
+        """Return ``(Longl_F, C1_width, longl)`` without building ``TUPLE``.
+
+        The same triple ``encode_tokens`` returns, with the encoded length
+        in place of the stream itself: ``histogram_cost`` over the full
+        tokens plus the short last token, if any.  Each ``(En, rule)`` is
+        priced once; later calls, and results handed to ``store`` (see
+        black_hole.parallel), are returned as they are.
+        """
+        cached = self._lengths.get((En, rule))
+        if cached is not None:
+            return cached
+        full = self.size // En
+        longl = self.size - full * En
+        total = 0
+        hit = False
+        if full:
+            total, hit = histogram_cost(En, self.histogram(En), rule)
+        if longl:
+            cost, rewritten = token_cost(
+                En, self.bits.get(full * En, longl), longl, rule
+            )
+            total += cost
+            hit = hit or rewritten
+        elif full:
+            longl = En
+        result = total, En.bit_length() if hit else 0, longl
+        self._lengths[En, rule] = result
+        return result
+
+    def store(self, En, rule, result):
+        """Record an ``encoded_length`` result computed elsewhere."""
+        self._lengths[En, rule] = result
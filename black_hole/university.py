@@ -0,0 +1,31 @@
+"""The fields of the ``University`` counter in the formula search.
+
+Every iteration of Black_Hole_26/27/28/56 wrote ``University`` out as a
+``(8*X2)+40``-bit string and sliced it into six fields, then wrote
+several fields back out as 24- and 40-bit strings only to parse them
+again.  ``decode_university`` reads the same fields with shifts and masks.
+"""
+
+_BYTE = 0xFF
+
+
+def decode_university(University, X2):
+    """Split *University* as the loops did, without building strings.
+
+    Returns ``(Divide, Times_12, Multiply, Add_Numbers, SQUARE_OF_ROOT,
+    Multiply_Times)``: the leading ``8*X2`` bits, then five bytes.  As
+    with ``format(University, "0%db" % (8*X2+40))``, a *University* wider
+    than that is not cut down; the fields are read from its leading bits.
+    *University* must not be negative.
+    """
+    extra = University.bit_length() - (8 * X2 + 40)
+    if extra > 0:
+        University >>= extra
+    return (
+        University >> 40,
+        (University >> 32) & _BYTE,
+        (University >> 24) & _BYTE,
+        (University >> 16) & _BYTE,
+        (University >> 8) & _BYTE,
+        University & _BYTE,
+    )